@@ -1,16 +1,90 @@
-from sqlalchemy import create_engine, Column, String, Float, DateTime, Text, JSON
+from sqlalchemy import event, inspect, Computed, Index, Column, String, Float, DateTime, Text, JSON
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool, AsyncAdaptedQueuePool
+import asyncio
 import os
 from datetime import datetime
 
-DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./evaluations.db")
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+DATABASE_URL = os.getenv("DATABASE_URL", "sqlite+aiosqlite:///./evaluations.db")
+_IS_SQLITE = DATABASE_URL.startswith("sqlite")
+# A bare sqlite:// (no path) is in-memory, same as :memory:
+_IS_MEMORY = _IS_SQLITE and (
+    ":memory:" in DATABASE_URL or DATABASE_URL.split("://", 1)[-1].strip("/") == ""
+)
+# Plain sqlite:// URLs (e.g. from an older .env) are routed through the async driver
+if DATABASE_URL.startswith("sqlite:"):
+    DATABASE_URL = DATABASE_URL.replace("sqlite:", "sqlite+aiosqlite:", 1)
+
+if _IS_MEMORY:
+    engine = create_async_engine(DATABASE_URL, poolclass=StaticPool)
+else:
+    # Keep connections around so the per-connection PRAGMAs below (and SQLite's
+    # page cache) survive between requests instead of being re-applied each time.
+    # Opening an aiosqlite connection costs a thread plus a file open, so pooled
+    # connections are never recycled or pinged.
+    engine = create_async_engine(
+        DATABASE_URL,
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=int(os.getenv("DB_POOL_SIZE", "10")),
+        max_overflow=5,
+        pool_recycle=-1,
+        pool_pre_ping=False,
+    )
+
+# WAL lets /runs and /dashboard/stats read while /evaluate is writing, and
+# synchronous=NORMAL drops the per-commit fsync count (safe under WAL).
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA temp_store=MEMORY",
+)
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+if _IS_SQLITE and not _IS_MEMORY:
+    event.listen(engine.sync_engine, "connect", _set_sqlite_pragmas)
+
+    # All writes go through one dedicated connection, serialized by write_lock,
+    # so they never contend with each other for SQLite's write lock while the
+    # pooled connections above serve reads.
+    write_engine = create_async_engine(DATABASE_URL, poolclass=StaticPool)
+
+    @event.listens_for(write_engine.sync_engine, "connect")
+    def _set_writer_pragmas(dbapi_connection, connection_record):
+        _set_sqlite_pragmas(dbapi_connection, connection_record)
+        # Let the begin hook below issue BEGIN instead of the driver
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(write_engine.sync_engine, "begin")
+    def _begin_immediate(conn):
+        # Take the write lock up front rather than upgrading mid-transaction
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+else:
+    write_engine = engine
+
+async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+write_session = async_sessionmaker(write_engine, class_=AsyncSession, expire_on_commit=False)
+write_lock = asyncio.Lock()
 Base = declarative_base()
 
 class EvaluationRun(Base):
     __tablename__ = "evaluation_runs"
+    __table_args__ = (
+        # Dashboard aggregation filters on status; /runs orders by (timestamp, id)
+        Index("ix_runs_status_ts", "status", "timestamp"),
+        Index("ix_runs_ts_id", "timestamp", "id"),
+    )
+    # Read the generated status back via INSERT ... RETURNING
+    __mapper_args__ = {"eager_defaults": True}
     
     id = Column(String, primary_key=True, index=True)
     prompt = Column(Text, nullable=False)
@@ -19,16 +93,54 @@ class EvaluationRun(Base):
     objective = Column(String, nullable=False)
     model = Column(String, nullable=False)
     score = Column(Float, nullable=False)
-    status = Column(String, nullable=False)
-    timestamp = Column(DateTime, nullable=False, default=datetime.utcnow)
+    # Always a function of score, so SQLite derives it (VIRTUAL: no extra bytes per row)
+    status = Column(
+        String,
+        Computed("CASE WHEN score > 0 THEN 'completed' ELSE 'failed' END", persisted=False),
+        index=True,
+    )
+    timestamp = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
     objectives = Column(JSON, nullable=True)
     error_message = Column(Text, nullable=True)
 
-Base.metadata.create_all(bind=engine)
+def _migrate_status_to_generated(connection):
+    """Rebuild tables created before status became a generated column"""
+    table = EvaluationRun.__table__
+    if connection.dialect.name != "sqlite" or not inspect(connection).has_table(table.name):
+        return
+    # table_xinfo marks generated columns as hidden=2 (virtual) or 3 (stored)
+    columns = connection.exec_driver_sql(f"PRAGMA table_xinfo({table.name})").fetchall()
+    if any(column[1] == "status" and column[6] in (2, 3) for column in columns):
+        return
+    
+    for index in table.indexes:
+        connection.exec_driver_sql(f"DROP INDEX IF EXISTS {index.name}")
+    connection.exec_driver_sql(f"ALTER TABLE {table.name} RENAME TO {table.name}_old")
+    table.create(connection)
+    copied = ", ".join(column.name for column in table.columns if column.computed is None)
+    connection.exec_driver_sql(
+        f"INSERT INTO {table.name} ({copied}) SELECT {copied} FROM {table.name}_old"
+    )
+    connection.exec_driver_sql(f"DROP TABLE {table.name}_old")
+
+def _create_schema(connection):
+    _migrate_status_to_generated(connection)
+    Base.metadata.create_all(connection)
+    # create_all skips tables that already exist, so databases created before
+    # an index was added need it created explicitly
+    for index in EvaluationRun.__table__.indexes:
+        index.create(connection, checkfirst=True)
 
-def get_db():
-    db = SessionLocal()
-    try:
+async def init_db():
+    """Create tables on startup (the async engine can't run DDL at import time)"""
+    async with write_engine.begin() as conn:
+        await conn.run_sync(_create_schema)
+
+async def get_db():
+    async with async_session() as db:
+        yield db
+
+async def get_write_db():
+    """Session on the writer connection; hold write_lock around its transactions"""
+    async with write_session() as db:
         yield db
-    finally:
-        db.close()
\ No newline at end of file
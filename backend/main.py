@@ -1,17 +1,31 @@
-from fastapi import FastAPI, HTTPException, Depends
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException, Depends, Query, Body
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi.responses import JSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime
+from typing import List, Optional
 import os
+import orjson
 from dotenv import load_dotenv
 
-from database import get_db
-from models import EvaluationRequest, EvaluationResponse, EvaluationRun, DashboardStats
-from services import run_evaluation, get_all_runs, get_run_by_id, get_dashboard_stats
+from database import get_db, get_write_db, init_db
+from models import EvaluationRequest, EvaluationResponse, EvaluationRun, RunSummary, DashboardStats
+from services import run_evaluation, run_batch_evaluation, get_all_runs, get_run_by_id, get_dashboard_stats, EVAL_BATCH_MAX_SIZE
 
 load_dotenv()
 
-app = FastAPI(title="OmniBAR API", version="1.0.0")
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered by orjson (native datetime support, C encoder)"""
+    def render(self, content) -> bytes:
+        return orjson.dumps(content)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await init_db()
+    yield
+
+app = FastAPI(title="OmniBAR API", version="1.0.0", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -22,28 +36,42 @@ app.add_middleware(
 )
 
 @app.post("/evaluate", response_model=EvaluationResponse)
-async def evaluate(request: EvaluationRequest, db: Session = Depends(get_db)):
+async def evaluate(request: EvaluationRequest, db: AsyncSession = Depends(get_write_db)):
     """Run a new evaluation"""
     return await run_evaluation(request, db)
 
-@app.get("/runs", response_model=List[EvaluationRun])
-async def get_runs(db: Session = Depends(get_db)):
-    """Get all evaluation runs"""
-    runs = get_all_runs(db)
-    return runs
+@app.post("/evaluate/batch", response_model=List[EvaluationResponse])
+async def evaluate_batch(
+    requests: List[EvaluationRequest] = Body(..., max_length=EVAL_BATCH_MAX_SIZE),
+    db: AsyncSession = Depends(get_write_db),
+):
+    """Run several evaluations and store them in a single transaction"""
+    return await run_batch_evaluation(requests, db)
+
+@app.get("/runs", response_model=List[RunSummary], response_class=ORJSONResponse)
+async def get_runs(
+    limit: Optional[int] = Query(None, ge=1, le=500),
+    before: Optional[datetime] = None,
+    before_id: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
+):
+    """Get evaluation runs, newest first (all of them unless a page size is given)"""
+    runs = await get_all_runs(db, limit=limit, before=before, before_id=before_id)
+    # Rows come straight from the table, so skip re-validating each one against the model
+    return ORJSONResponse(content=runs)
 
 @app.get("/runs/{run_id}", response_model=EvaluationRun)
-async def get_run(run_id: str, db: Session = Depends(get_db)):
+async def get_run(run_id: str, db: AsyncSession = Depends(get_db)):
     """Get specific evaluation run"""
-    run = get_run_by_id(db, run_id)
+    run = await get_run_by_id(db, run_id)
     if not run:
         raise HTTPException(status_code=404, detail="Run not found")
     return run
 
 @app.get("/dashboard/stats", response_model=DashboardStats)
-async def get_stats(db: Session = Depends(get_db)):
-    """Get dashboard statistics"""
-    return get_dashboard_stats(db)
+async def get_stats(since: Optional[datetime] = Query(None), db: AsyncSession = Depends(get_db)):
+    """Get dashboard statistics (defaults to the last 30 days)"""
+    return await get_dashboard_stats(db, since=since)
 
 @app.get("/")
 async def root():
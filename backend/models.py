@@ -21,7 +21,8 @@ class EvaluationResponse(BaseModel):
     timestamp: str
     error_message: Optional[str] = None
 
-class EvaluationRun(BaseModel):
+class RunSummary(BaseModel):
+    """A run as listed by GET /runs (without the per-objective breakdown)"""
     id: str
     prompt: str
     expected_output: Optional[str]
@@ -31,9 +32,11 @@ class EvaluationRun(BaseModel):
     score: float
     status: str
     timestamp: datetime
-    objectives: Optional[Dict[str, Any]] = None
     error_message: Optional[str] = None
 
+class EvaluationRun(RunSummary):
+    objectives: Optional[Dict[str, Any]] = None
+
 class DashboardStats(BaseModel):
     totalRuns: int
     averageScore: float
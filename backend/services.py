@@ -1,31 +1,74 @@
+import asyncio
+import logging
 import os
+import time
 import uuid
-from datetime import datetime
-from typing import Dict, Any, Optional
-from sqlalchemy.orm import Session
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
+from sqlalchemy import select, func, case, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from omnibar import OmniBarmarker, Benchmark
 from omnibar.objectives import StringEqualityObjective, LLMJudgeObjective, CombinedBenchmarkObjective
 from omnibar.core.types import BoolEvalResult, FloatEvalResult, EvalResult
 from langchain_openai import ChatOpenAI
+from langchain.prompts import PromptTemplate
+from langchain_core.output_parsers import JsonOutputParser
 from pydantic import BaseModel, Field
 
-from database import EvaluationRun as DBEvaluationRun
-from models import EvaluationRequest, EvaluationResponse, DashboardStats
+from database import EvaluationRun as DBEvaluationRun, write_lock
+from models import EvaluationRequest, EvaluationResponse, RunSummary, DashboardStats
 from dotenv import load_dotenv
 load_dotenv()  
 
+logger = logging.getLogger(__name__)
+
+# /dashboard/stats is polled far more often than evaluations are written, so the
+# aggregate is memoized until the next write (or the TTL, for writes made by
+# other processes).
+STATS_CACHE_TTL = float(os.getenv("STATS_CACHE_TTL", "10"))
+_write_epoch = 0
+_stats_cache: Dict[str, Any] = {"value": None, "epoch": -1, "expires_at": 0.0}
+# Dashboard stats cover recent activity only, so the query is an index range scan
+STATS_WINDOW_DAYS = int(os.getenv("STATS_WINDOW_DAYS", "30"))
+
+# Iterations are independent LLM round-trips, so they run concurrently up to this cap
+EVAL_MAX_CONCURRENT = int(os.getenv("EVAL_MAX_CONCURRENT", "8"))
+# Evaluations in flight across all requests (each may fan out EVAL_MAX_CONCURRENT
+# calls), so a large batch queues instead of opening batch_size x 8 connections
+EVAL_MAX_RUNS = int(os.getenv("EVAL_MAX_RUNS", "4"))
+_evaluation_slots = asyncio.Semaphore(EVAL_MAX_RUNS)
+# Largest list accepted by POST /evaluate/batch
+EVAL_BATCH_MAX_SIZE = int(os.getenv("EVAL_BATCH_MAX_SIZE", "20"))
+
+DEFAULT_JUDGE_GOAL = "Evaluate the quality of this response"
+
+def _mark_runs_written() -> None:
+    """Invalidate cached aggregates after evaluation runs were committed"""
+    global _write_epoch
+    _write_epoch += 1
+
+@lru_cache(maxsize=None)
+def _get_chat_model(model: str, api_key: Optional[str]) -> ChatOpenAI:
+    """One ChatOpenAI per model, so its HTTP connection pool (and TLS sessions) is shared across evaluations"""
+    return ChatOpenAI(
+        model=model,
+        temperature=0,
+        openai_api_key=api_key
+    )
+
 class SimpleAgent:
     def __init__(self, model: str):
-        self.llm = ChatOpenAI(
-            model=model,
-            temperature=0,
-            openai_api_key=os.getenv("OPENAI_API_KEY")
-        )
+        self.llm = _get_chat_model(model, os.getenv("OPENAI_API_KEY"))
     
     def invoke(self, query: str) -> Dict[str, Any]:
         response = self.llm.invoke(query)
         return {"response": response.content}
+    
+    async def ainvoke(self, query: str) -> Dict[str, Any]:
+        response = await self.llm.ainvoke(query)
+        return {"response": response.content}
 
 def create_agent_for_model(model: str):
     """Create agent based on model selection"""
@@ -40,6 +83,53 @@ def create_agent_for_model(model: str):
     
     return SimpleAgent(model)
 
+class LLMPartialOutputSchema(BaseModel):
+    result: float = Field(description="A score between 0 and 1 indicating how close the output is to the expected output")
+    message: str = Field(description="A message explaining why the output is correct or not")
+
+LLM_JUDGE_TEMPLATE = """Your job is to judge the output of an AI Agent and return a score between 0 and 1 indicating how close the output is to the expected output and a message explaining why.
+
+The expected output is:
+{expected_output}
+
+The output of the AI Agent is:
+{input}
+
+The format of the output should be:
+{format_instructions}"""
+
+@lru_cache(maxsize=128)
+def _build_llm_judge_chain(expected_output: str, api_key: str, model: str = "gpt-4"):
+    """Build (once per expected output) the judge chain and return its invoke method"""
+    llm = _get_chat_model(model, api_key)
+    parser = JsonOutputParser(pydantic_object=LLMPartialOutputSchema)
+    
+    prompt = PromptTemplate(
+        template=LLM_JUDGE_TEMPLATE,
+        input_variables=["input"],
+        partial_variables={
+            "format_instructions": parser.get_format_instructions(),
+            "expected_output": expected_output
+        }
+    )
+    
+    chain = prompt | llm | parser
+    return chain.invoke
+
+def _create_llm_judge_objective(expected_output: Optional[str], objective_label: str) -> LLMJudgeObjective:
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        raise ValueError(f"OPENAI_API_KEY environment variable is required for {objective_label} objective")
+    
+    goal = expected_output or DEFAULT_JUDGE_GOAL
+    return LLMJudgeObjective(
+        name="llm_judge",
+        output_key="response",
+        goal=goal,
+        valid_eval_result_type=FloatEvalResult,
+        invoke_method=_build_llm_judge_chain(goal, api_key)
+    )
+
 def create_objective_from_request(objective: str, expected_output: Optional[str] = None):
     """Create OmniBAR objective from request"""
     if objective == "string-equality":
@@ -52,51 +142,7 @@ def create_objective_from_request(objective: str, expected_output: Optional[str]
             valid_eval_result_type=BoolEvalResult
         )
     elif objective == "llm-judge":
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
-            raise ValueError("OPENAI_API_KEY environment variable is required for LLM Judge objective")
-        
-        def create_llm_judge_invoke():
-            from langchain_openai import ChatOpenAI
-            from langchain.prompts import PromptTemplate
-            from langchain_core.output_parsers import JsonOutputParser
-            from omnibar.core.types import FloatEvalResult
-            
-            class LLMPartialOutputSchema(BaseModel):
-                result: float = Field(description="A score between 0 and 1 indicating how close the output is to the expected output")
-                message: str = Field(description="A message explaining why the output is correct or not")
-            
-            llm = ChatOpenAI(model="gpt-4", temperature=0, openai_api_key=api_key)
-            parser = JsonOutputParser(pydantic_object=LLMPartialOutputSchema)
-            
-            prompt = PromptTemplate(
-                template="""Your job is to judge the output of an AI Agent and return a score between 0 and 1 indicating how close the output is to the expected output and a message explaining why.
-
-The expected output is:
-{expected_output}
-
-The output of the AI Agent is:
-{input}
-
-The format of the output should be:
-{format_instructions}""",
-                input_variables=["input"],
-                partial_variables={
-                    "format_instructions": parser.get_format_instructions(),
-                    "expected_output": expected_output or "Evaluate the quality of this response"
-                }
-            )
-            
-            chain = prompt | llm | parser
-            return chain.invoke
-        
-        return LLMJudgeObjective(
-            name="llm_judge",
-            output_key="response",
-            goal=expected_output or "Evaluate the quality of this response",
-            valid_eval_result_type=FloatEvalResult,
-            invoke_method=create_llm_judge_invoke()
-        )
+        return _create_llm_judge_objective(expected_output, "LLM Judge")
     elif objective == "combined":
         string_obj = StringEqualityObjective(
             name="string_equality",
@@ -105,50 +151,7 @@ The format of the output should be:
             valid_eval_result_type=BoolEvalResult
         )
         
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
-            raise ValueError("OPENAI_API_KEY environment variable is required for combined objective")
-        
-        def create_llm_judge_invoke():
-            from langchain_openai import ChatOpenAI
-            from langchain.prompts import PromptTemplate
-            from langchain_core.output_parsers import JsonOutputParser
-            
-            class LLMPartialOutputSchema(BaseModel):
-                result: float = Field(description="A score between 0 and 1 indicating how close the output is to the expected output")
-                message: str = Field(description="A message explaining why the output is correct or not")
-            
-            llm = ChatOpenAI(model="gpt-4", temperature=0, openai_api_key=api_key)
-            parser = JsonOutputParser(pydantic_object=LLMPartialOutputSchema)
-            
-            prompt = PromptTemplate(
-                template="""Your job is to judge the output of an AI Agent and return a score between 0 and 1 indicating how close the output is to the expected output and a message explaining why.
-
-The expected output is:
-{expected_output}
-
-The output of the AI Agent is:
-{input}
-
-The format of the output should be:
-{format_instructions}""",
-                input_variables=["input"],
-                partial_variables={
-                    "format_instructions": parser.get_format_instructions(),
-                    "expected_output": expected_output or "Evaluate the quality of this response"
-                }
-            )
-            
-            chain = prompt | llm | parser
-            return chain.invoke
-        
-        llm_obj = LLMJudgeObjective(
-            name="llm_judge",
-            output_key="response",
-            goal=expected_output or "Evaluate the quality of this response",
-            valid_eval_result_type=FloatEvalResult,
-            invoke_method=create_llm_judge_invoke()
-        )
+        llm_obj = _create_llm_judge_objective(expected_output, "combined")
         
         return CombinedBenchmarkObjective(
             name="combined_evaluation",
@@ -157,98 +160,98 @@ The format of the output should be:
     else:
         raise ValueError(f"Unsupported objective: {objective}")
 
-def extract_evaluation_results(benchmarker: OmniBarmarker, run_id: str, request: EvaluationRequest) -> Dict[str, Any]:
-    """Extract results from OmniBAR benchmarker"""
-    logs = benchmarker.logger.get_all_logs()
-    if not logs:
-        return {
-            "run_id": run_id,
-            "status": "failed",
-            "score": 0.0,
-            "timestamp": datetime.now().isoformat(),
-            "error_message": "No evaluation results found"
-        }
-    
-    if request.objective == "combined":
-        return extract_combined_results(logs, run_id, request)
-    
+def _latest_entry(logs):
     latest_log = logs[-1]
+    return latest_log.entries[-1] if latest_log.entries else None
+
+def _log_entry_debug(entry, request: EvaluationRequest) -> None:
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Agent response: %r", entry.evaluated_output.get("response", ""))
+        logger.debug("Expected output: %r", request.expected_output)
+        logger.debug("Evaluation result: %s", entry.eval_result)
+
+def _no_entries_result(run_id: str) -> Dict[str, Any]:
+    return {
+        "run_id": run_id,
+        "score": 0.0,
+        "timestamp": datetime.now().isoformat(),
+        "error_message": "No evaluation entries found"
+    }
+
+def _extract_string_equality(logs, run_id: str, request: EvaluationRequest) -> Dict[str, Any]:
+    """String equality yields a BoolEvalResult: all or nothing"""
+    entry = _latest_entry(logs)
+    if entry is None:
+        return _no_entries_result(run_id)
+    _log_entry_debug(entry, request)
     
-    if not latest_log.entries:
-        return {
-            "run_id": run_id,
-            "status": "failed",
-            "score": 0.0,
-            "timestamp": datetime.now().isoformat(),
-            "error_message": "No evaluation entries found"
-        }
-    
-    latest_entry = latest_log.entries[-1]
-    
-    agent_response = latest_entry.evaluated_output.get("response", "")
-    
-    print(f"DEBUG: Agent response: '{agent_response}'")
-    print(f"DEBUG: Expected output: '{request.expected_output}'")
-    print(f"DEBUG: Evaluation result: {latest_entry.eval_result}")
-    
-    result_value = latest_entry.eval_result[0] 
-    message_value = latest_entry.eval_result[1] if len(latest_entry.eval_result) > 1 else None
-    
-    print(f"DEBUG: result_value: {result_value} (type: {type(result_value)})")
-    print(f"DEBUG: message_value: {message_value}")
-    
-    if isinstance(result_value, bool):
-        score = 100.0 if result_value else 0.0
-    elif isinstance(result_value, (int, float)):
-        score = float(result_value) * 100
-    else:
-        score = 0.0
-    
-    status = "completed" if score > 0 else "failed"
+    passed = bool(entry.eval_result[0])
+    score = 100.0 if passed else 0.0
     
-    objectives = None
-    if request.objective == "string-equality":
-        objectives = {
+    return {
+        "run_id": run_id,
+        "score": score,
+        "agent_response": entry.evaluated_output.get("response", ""),
+        "objectives": {
             "stringEquality": {
-                "passed": bool(result_value),
+                "passed": passed,
                 "score": int(score)
             }
-        }
-    elif request.objective == "llm-judge":
-        objectives = {
+        },
+        "timestamp": datetime.now().isoformat()
+    }
+
+def _extract_llm_judge(logs, run_id: str, request: EvaluationRequest) -> Dict[str, Any]:
+    """LLM judge yields a FloatEvalResult in [0, 1] plus the judge's reasoning"""
+    entry = _latest_entry(logs)
+    if entry is None:
+        return _no_entries_result(run_id)
+    _log_entry_debug(entry, request)
+    
+    result_value = entry.eval_result[0]
+    message_value = entry.eval_result[1] if len(entry.eval_result) > 1 else None
+    # Invalid eval results carry None
+    score = float(result_value) * 100 if isinstance(result_value, (int, float)) else 0.0
+    
+    return {
+        "run_id": run_id,
+        "score": score,
+        "agent_response": entry.evaluated_output.get("response", ""),
+        "objectives": {
             "llmJudge": {
                 "passed": score > 0,
                 "score": int(score),
                 "reasoning": message_value or ""
             }
-        }
-    
-    return {
-        "run_id": run_id,
-        "status": status,
-        "score": score,
-        "agent_response": agent_response,
-        "objectives": objectives,
+        },
         "timestamp": datetime.now().isoformat()
     }
 
+def extract_evaluation_results(benchmarker: OmniBarmarker, run_id: str, request: EvaluationRequest) -> Dict[str, Any]:
+    """Extract results from OmniBAR benchmarker"""
+    logs = benchmarker.logger.get_all_logs()
+    if not logs:
+        return {
+            "run_id": run_id,
+            "score": 0.0,
+            "timestamp": datetime.now().isoformat(),
+            "error_message": "No evaluation results found"
+        }
+    
+    return _EXTRACTORS[request.objective](logs, run_id, request)
+
 def extract_combined_results(logs, run_id: str, request: EvaluationRequest) -> Dict[str, Any]:
     """Extract results for combined objectives"""
-    print(f"DEBUG: Processing combined results from {len(logs)} logs")
+    logger.debug("Processing combined results from %d logs", len(logs))
     
-    string_log = None
-    llm_log = None
+    # Sub-objective names are fixed by create_objective_from_request, so index once
+    # and look them up directly instead of scanning every log
+    logs_by_objective = {log.metadata.get('objective_name', ''): log for log in logs if log.entries}
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Found logs for objectives: %s", list(logs_by_objective))
     
-    for log in logs:
-        if log.entries:
-            entry = log.entries[-1]
-            objective_name = log.metadata.get('objective_name', '')
-            print(f"DEBUG: Found log with objective: {objective_name}")
-            
-            if 'string_equality' in objective_name:
-                string_log = log
-            elif 'llm_judge' in objective_name:
-                llm_log = log
+    string_log = logs_by_objective.get("string_equality")
+    llm_log = logs_by_objective.get("llm_judge")
     
     agent_response = ""
     if logs and logs[0].entries:
@@ -261,7 +264,7 @@ def extract_combined_results(logs, run_id: str, request: EvaluationRequest) -> D
         result_value = entry.eval_result[0]
         string_passed = bool(result_value)
         string_score = 100 if string_passed else 0
-        print(f"DEBUG: String equality - passed: {string_passed}, score: {string_score}")
+        logger.debug("String equality - passed: %s, score: %s", string_passed, string_score)
     
     llm_passed = False
     llm_score = 0
@@ -275,11 +278,9 @@ def extract_combined_results(logs, run_id: str, request: EvaluationRequest) -> D
             llm_score = int(float(result_value) * 100)
             llm_passed = llm_score > 0
         llm_reasoning = message_value or ""
-        print(f"DEBUG: LLM judge - passed: {llm_passed}, score: {llm_score}, reasoning: {llm_reasoning}")
+        logger.debug("LLM judge - passed: %s, score: %s, reasoning: %s", llm_passed, llm_score, llm_reasoning)
     
     overall_score = (string_score + llm_score) / 2
-    status = "completed" if overall_score > 0 else "failed"
-    
     objectives = {
         "stringEquality": {
             "passed": string_passed,
@@ -294,16 +295,24 @@ def extract_combined_results(logs, run_id: str, request: EvaluationRequest) -> D
     
     return {
         "run_id": run_id,
-        "status": status,
         "score": overall_score,
         "agent_response": agent_response,
         "objectives": objectives,
         "timestamp": datetime.now().isoformat()
     }
 
+# One extractor per objective accepted by create_objective_from_request
+_EXTRACTORS = {
+    "string-equality": _extract_string_equality,
+    "llm-judge": _extract_llm_judge,
+    "combined": extract_combined_results,
+}
 
-async def run_evaluation(request: EvaluationRequest, db: Session) -> EvaluationResponse:
-    """Run evaluation using OmniBAR"""
+async def _evaluate(request: EvaluationRequest) -> Tuple[DBEvaluationRun, Dict[str, Any]]:
+    """Run a single evaluation with OmniBAR without touching the database
+    
+    Returns the row to store and the response data (everything but status).
+    """
     run_id = str(uuid.uuid4())
     
     try:
@@ -321,10 +330,13 @@ async def run_evaluation(request: EvaluationRequest, db: Session) -> EvaluationR
         benchmarker = OmniBarmarker(
             executor_fn=lambda: agent,
             executor_kwargs={},
+            agent_invoke_method_name="ainvoke",
             initial_input=[benchmark]
         )
         
-        await benchmarker.benchmark_async(max_concurrent=1)
+        concurrency = max(1, min(request.iterations, EVAL_MAX_CONCURRENT))
+        async with _evaluation_slots:
+            await benchmarker.benchmark_async(max_concurrent=concurrency)
         
         result_data = extract_evaluation_results(benchmarker, run_id, request)
         
@@ -336,14 +348,11 @@ async def run_evaluation(request: EvaluationRequest, db: Session) -> EvaluationR
             objective=request.objective,
             model=request.model,
             score=result_data["score"],
-            status=result_data["status"],
             objectives=result_data.get("objectives"),
             error_message=result_data.get("error_message")
         )
-        db.add(db_run)
-        db.commit()
         
-        return EvaluationResponse(**result_data)
+        return db_run, result_data
         
     except Exception as e:
         error_data = {
@@ -354,46 +363,115 @@ async def run_evaluation(request: EvaluationRequest, db: Session) -> EvaluationR
             "objective": request.objective,
             "model": request.model,
             "score": 0.0,
-            "status": "failed",
             "objectives": None,
             "error_message": str(e)
         }
         
         db_run = DBEvaluationRun(**error_data)
-        db.add(db_run)
-        db.commit()
         
-        return EvaluationResponse(
-            run_id=run_id,
-            status="failed",
-            score=0.0,
-            timestamp=datetime.now().isoformat(),
-            error_message=str(e)
-        )
+        return db_run, {
+            "run_id": run_id,
+            "score": 0.0,
+            "timestamp": datetime.now().isoformat(),
+            "error_message": str(e)
+        }
 
-def get_all_runs(db: Session):
-    """Get all evaluation runs"""
-    runs = db.query(DBEvaluationRun).order_by(DBEvaluationRun.timestamp.desc()).all()
-    return runs
+def _build_response(db_run: DBEvaluationRun, result_data: Dict[str, Any]) -> EvaluationResponse:
+    # status is generated by the database from score and read back on insert.
+    # Every field was produced here (or by the DB), so skip re-validation.
+    return EvaluationResponse.model_construct(**result_data, status=db_run.status)
 
-def get_run_by_id(db: Session, run_id: str):
+async def run_evaluation(request: EvaluationRequest, db: AsyncSession) -> EvaluationResponse:
+    """Run evaluation using OmniBAR"""
+    db_run, result_data = await _evaluate(request)
+    
+    async with write_lock, db.begin():
+        db.add(db_run)
+    _mark_runs_written()
+    
+    return _build_response(db_run, result_data)
+
+async def run_batch_evaluation(requests: List[EvaluationRequest], db: AsyncSession) -> List[EvaluationResponse]:
+    """Run several evaluations concurrently and store them in one transaction"""
+    results = await asyncio.gather(*(_evaluate(request) for request in requests))
+    
+    async with write_lock, db.begin():
+        db.add_all([db_run for db_run, _ in results])
+    _mark_runs_written()
+    
+    return [_build_response(db_run, result_data) for db_run, result_data in results]
+
+# The runs list never shows the per-objective breakdown, so its JSON blob is
+# only loaded by get_run_by_id. prompt/agent_response stay: the list searches them.
+# Selecting exactly RunSummary's fields keeps the rows in step with the /runs docs.
+RUN_LIST_COLUMNS = [DBEvaluationRun.__table__.columns[name] for name in RunSummary.model_fields]
+
+async def get_all_runs(
+    db: AsyncSession,
+    limit: Optional[int] = None,
+    before: Optional[datetime] = None,
+    before_id: Optional[str] = None,
+):
+    """Get evaluation runs, newest first, optionally one page at a time
+    
+    `before` and `before_id` are a keyset cursor: pass the timestamp and id of
+    the last run of the previous page to fetch the next one. The id breaks ties
+    between runs sharing a timestamp; with `before` alone, only strictly older
+    runs are returned.
+    """
+    # Plain column rows instead of ORM entities: the list endpoint serializes
+    # the mappings directly, without identity-map or per-row model overhead
+    query = select(*RUN_LIST_COLUMNS)
+    if before is not None:
+        if before_id is not None:
+            query = query.where(
+                tuple_(DBEvaluationRun.timestamp, DBEvaluationRun.id) < tuple_(before, before_id)
+            )
+        else:
+            query = query.where(DBEvaluationRun.timestamp < before)
+    query = query.order_by(DBEvaluationRun.timestamp.desc(), DBEvaluationRun.id.desc()).limit(limit)
+    
+    result = await db.execute(query)
+    return [dict(row) for row in result.mappings()]
+
+async def get_run_by_id(db: AsyncSession, run_id: str):
     """Get specific evaluation run"""
-    return db.query(DBEvaluationRun).filter(DBEvaluationRun.id == run_id).first()
+    return await db.get(DBEvaluationRun, run_id)
+
+async def get_dashboard_stats(db: AsyncSession, since: Optional[datetime] = None) -> DashboardStats:
+    """Get dashboard statistics for runs since `since` (default: the last STATS_WINDOW_DAYS days)"""
+    # Only the default window is cached; explicit windows are ad-hoc queries
+    use_cache = since is None
+    if use_cache and _stats_cache["epoch"] == _write_epoch and time.monotonic() < _stats_cache["expires_at"]:
+        return _stats_cache["value"]
+    
+    epoch = _write_epoch
+    if since is None:
+        since = datetime.utcnow() - timedelta(days=STATS_WINDOW_DAYS)
+    stats = await _compute_dashboard_stats(db, since)
+    if use_cache:
+        _stats_cache.update(value=stats, epoch=epoch, expires_at=time.monotonic() + STATS_CACHE_TTL)
+    return stats
 
-def get_dashboard_stats(db: Session) -> DashboardStats:
-    """Get dashboard statistics"""
-    runs = db.query(DBEvaluationRun).all()
+async def _compute_dashboard_stats(db: AsyncSession, since: datetime) -> DashboardStats:
+    is_completed = DBEvaluationRun.status == "completed"
+    result = await db.execute(
+        select(
+            func.count().label("total"),
+            func.avg(case((is_completed, DBEvaluationRun.score))).label("average"),
+            func.sum(case((is_completed, 1), else_=0)).label("completed"),
+        ).where(DBEvaluationRun.timestamp >= since)
+    )
+    row = result.one()
     
-    if not runs:
+    if not row.total:
         return DashboardStats(totalRuns=0, averageScore=0.0, successRate=0.0)
     
-    total_runs = len(runs)
-    completed_runs = [r for r in runs if r.status == "completed"]
-    average_score = sum(r.score for r in completed_runs) / len(completed_runs) if completed_runs else 0.0
-    success_rate = (len(completed_runs) / total_runs) * 100 if total_runs > 0 else 0.0
+    average_score = row.average or 0.0
+    success_rate = (row.completed / row.total) * 100
     
     return DashboardStats(
-        totalRuns=total_runs,
+        totalRuns=row.total,
         averageScore=round(average_score, 2),
         successRate=round(success_rate, 2)
     )
\ No newline at end of file
@@ -1,39 +1,56 @@
 import pytest
+import asyncio
 import os
+from datetime import datetime
 from unittest.mock import Mock, patch
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.pool import NullPool
 
 # Import the main app and dependencies
 from main import app
-from database import get_db, Base
+from database import get_db, get_write_db, Base, EvaluationRun as DBEvaluationRun
 from models import EvaluationRequest
-from services import get_dashboard_stats, get_all_runs, get_run_by_id
+from services import get_dashboard_stats, get_all_runs, get_run_by_id, EVAL_BATCH_MAX_SIZE
 
 # Test database setup
-SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
-engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-
-def override_get_db():
-    try:
-        db = TestingSessionLocal()
+SQLALCHEMY_DATABASE_URL = "sqlite+aiosqlite:///./test.db"
+# NullPool: TestClient runs each request on its own event loop, so connections
+# must not be shared across loops
+engine = create_async_engine(SQLALCHEMY_DATABASE_URL, poolclass=NullPool)
+TestingSessionLocal = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+async def override_get_db():
+    async with TestingSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 app.dependency_overrides[get_db] = override_get_db
+app.dependency_overrides[get_write_db] = override_get_db
 
 # Create test client
 client = TestClient(app)
 
-@pytest.fixture(scope="module")
+async def _create_tables():
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+async def _drop_tables():
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+
+@pytest.fixture(autouse=True)
 def setup_database():
-    """Create test database tables"""
-    Base.metadata.create_all(bind=engine)
+    """Give each test freshly created (empty) test database tables"""
+    asyncio.run(_create_tables())
     yield
-    Base.metadata.drop_all(bind=engine)
+    asyncio.run(_drop_tables())
+
+def run_with_session(fn, *args):
+    """Run an async service function against the test database"""
+    async def _run():
+        async with TestingSessionLocal() as db:
+            return await fn(db, *args)
+    return asyncio.run(_run())
 
 def test_health_check():
     """Test the health check endpoint"""
@@ -47,6 +64,47 @@ def test_get_runs_empty():
     assert response.status_code == 200
     assert response.json() == []
 
+def test_get_runs_pagination_params():
+    """Test page size is bounded and validated"""
+    response = client.get("/runs", params={"limit": 1})
+    assert response.status_code == 200
+    assert len(response.json()) <= 1
+    
+    response = client.get("/runs", params={"before": "2000-01-01T00:00:00"})
+    assert response.status_code == 200
+    assert response.json() == []
+    
+    assert client.get("/runs", params={"limit": 0}).status_code == 422
+
+def test_get_runs_cursor_keeps_timestamp_ties():
+    """Test paging through runs that share a timestamp returns each run once"""
+    timestamp = datetime(2024, 1, 1)
+    async def _insert():
+        async with TestingSessionLocal() as db, db.begin():
+            db.add_all([
+                DBEvaluationRun(id=f"run-{i}", prompt="p", objective="string-equality",
+                                model="gpt-4", score=1.0, timestamp=timestamp)
+                for i in range(3)
+            ])
+    asyncio.run(_insert())
+    
+    assert len(client.get("/runs").json()) == 3
+    
+    seen = []
+    params = {"limit": 1}
+    while page := client.get("/runs", params=params).json():
+        seen.extend(run["id"] for run in page)
+        params = {"limit": 1, "before": page[-1]["timestamp"], "before_id": page[-1]["id"]}
+    assert seen == ["run-2", "run-1", "run-0"]
+
+def test_get_runs_schema_omits_objectives():
+    """Test the documented /runs item model matches the rows it returns"""
+    schema = client.get("/openapi.json").json()
+    items = schema["paths"]["/runs"]["get"]["responses"]["200"]["content"]["application/json"]["schema"]["items"]
+    run_summary = schema["components"]["schemas"][items["$ref"].rsplit("/", 1)[-1]]
+    assert "objectives" not in run_summary["properties"]
+    assert "objectives" in schema["components"]["schemas"]["EvaluationRun"]["properties"]
+
 def test_get_dashboard_stats_empty():
     """Test dashboard stats when no runs exist"""
     response = client.get("/dashboard/stats")
@@ -56,6 +114,12 @@ def test_get_dashboard_stats_empty():
     assert data["averageScore"] == 0.0
     assert data["successRate"] == 0.0
 
+def test_get_dashboard_stats_since():
+    """Test dashboard stats only count runs inside the requested window"""
+    response = client.get("/dashboard/stats", params={"since": "2999-01-01T00:00:00"})
+    assert response.status_code == 200
+    assert response.json()["totalRuns"] == 0
+
 def test_get_run_not_found():
     """Test getting a run that doesn't exist"""
     response = client.get("/runs/nonexistent-id")
@@ -104,6 +168,42 @@ def test_evaluate_invalid_model():
     response = client.post("/evaluate", json=request_data)
     assert response.status_code == 500
 
+def test_evaluate_batch_invalid_model():
+    """Test batch evaluation stores one failed run per request"""
+    request_data = {
+        "prompt": "What is 2 + 2?",
+        "expectedOutput": "4",
+        "objective": "string-equality",
+        "model": "invalid-model",
+        "iterations": 1
+    }
+    
+    response = client.post("/evaluate/batch", json=[request_data, request_data])
+    assert response.status_code == 200
+    
+    data = response.json()
+    assert len(data) == 2
+    assert all(result["status"] == "failed" for result in data)
+    assert data[0]["run_id"] != data[1]["run_id"]
+    for result in data:
+        assert client.get(f"/runs/{result['run_id']}").status_code == 200
+    
+    listed = client.get("/runs", params={"limit": 1}).json()
+    assert "objectives" not in listed[0]
+
+def test_evaluate_batch_too_large():
+    """Test batch evaluation rejects more requests than the batch limit"""
+    request_data = {
+        "prompt": "What is 2 + 2?",
+        "expectedOutput": "4",
+        "objective": "string-equality",
+        "model": "invalid-model",
+        "iterations": 1
+    }
+    
+    response = client.post("/evaluate/batch", json=[request_data] * (EVAL_BATCH_MAX_SIZE + 1))
+    assert response.status_code == 422
+
 def test_evaluate_missing_openai_key():
     """Test evaluation without OpenAI API key"""
     with patch.dict(os.environ, {}, clear=True):
@@ -120,35 +220,17 @@ def test_evaluate_missing_openai_key():
 
 def test_services_get_dashboard_stats():
     """Test dashboard stats service function"""
-    from database import SessionLocal
-    db = SessionLocal()
-    
-    try:
-        stats = get_dashboard_stats(db)
-        assert stats.totalRuns == 0
-        assert stats.averageScore == 0.0
-        assert stats.successRate == 0.0
-    finally:
-        db.close()
+    stats = run_with_session(get_dashboard_stats)
+    assert stats.totalRuns == 0
+    assert stats.averageScore == 0.0
+    assert stats.successRate == 0.0
 
 def test_services_get_all_runs():
     """Test get all runs service function"""
-    from database import SessionLocal
-    db = SessionLocal()
-    
-    try:
-        runs = get_all_runs(db)
-        assert isinstance(runs, list)
-    finally:
-        db.close()
+    runs = run_with_session(get_all_runs)
+    assert isinstance(runs, list)
 
 def test_services_get_run_by_id():
     """Test get run by id service function"""
-    from database import SessionLocal
-    db = SessionLocal()
-    
-    try:
-        run = get_run_by_id(db, "nonexistent-id")
-        assert run is None
-    finally:
-        db.close()
+    run = run_with_session(get_run_by_id, "nonexistent-id")
+    assert run is None
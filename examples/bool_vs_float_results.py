@@ -32,11 +32,92 @@ Usage:
 # No environment variables needed for this example!
 # This example uses only local evaluations - no external APIs required.
 
+import contextlib
+import io
+import os
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping
+
+import numpy as np
+
 from omnibar import OmniBarmarker, Benchmark
 from omnibar.objectives import StringEqualityObjective, RegexMatchObjective, CombinedBenchmarkObjective
 from omnibar.core.types import BoolEvalResult, FloatEvalResult
 
 
+def _template(**fields: str) -> Mapping[str, str]:
+    """Read-only response with interned values (StringEqualityObjective interns its goal too)."""
+    return MappingProxyType({key: sys.intern(value) for key, value in fields.items()})
+
+
+# Fixed answers are shared, read-only templates so invoke() doesn't rebuild them per call
+_CAPITAL_FRANCE = _template(
+    answer="Paris",
+    confidence="high",
+    explanation="Paris is the capital and largest city of France"
+)
+
+_LARGEST_PLANET = _template(
+    answer="Jupiter",
+    confidence="high", 
+    explanation="Jupiter is the largest planet in our solar system"
+)
+
+_PYTHON_CREATOR = _template(
+    answer="Guido van Rossum",
+    confidence="medium",
+    explanation="The creator of Python programming language"
+)
+
+# Deliberately wrong answer for "what is 4 squared" (should be 16)
+_MATH_WRONG_4 = _template(
+    answer="15",
+    confidence="medium",
+    explanation="I think 4 squared is 15"
+)
+
+_UNKNOWN = _template(
+    answer="I don't know",
+    confidence="none",
+    explanation="This question is outside my knowledge base"
+)
+
+
+# Batches smaller than this aren't worth the call into compiled code
+_JIT_MIN_BATCH = 256
+
+
+def _squares_kernel(nums, out):
+    """Square every number, except 4 which the quiz agent answers with 15."""
+    for i in range(nums.size):
+        n = nums[i]
+        out[i] = 15 if n == 4 else n * n
+
+
+# numba-compiled _squares_kernel: None until first needed, False without numba
+_jit_squares_kernel = None
+
+
+def _get_jit_squares_kernel():
+    """
+    Return the compiled squares kernel, or None when numba isn't installed.
+
+    numba is imported and the kernel compiled on the first batch large enough
+    to use it; the benchmarks below never get there.
+    """
+    global _jit_squares_kernel
+    if _jit_squares_kernel is None:
+        try:
+            from numba import njit
+        except ImportError:  # numba is optional; math_batch falls back to NumPy
+            _jit_squares_kernel = False
+        else:
+            _jit_squares_kernel = njit(cache=True)(_squares_kernel)
+    return _jit_squares_kernel or None
+
+
 class QuizAgent:
     """
     A simple quiz-answering agent for demonstrating different result types.
@@ -48,67 +129,93 @@ class QuizAgent:
     
     def __init__(self):
         """Initialize with knowledge base."""
-        self.knowledge = {
+        # Read-only: the agent is shared across benchmarks (see create_quiz_agent)
+        self.knowledge = MappingProxyType({
             "capital_france": "Paris",
             "largest_planet": "Jupiter", 
             "python_creator": "Guido van Rossum",
-            "squares": {2: 4, 3: 9, 4: 16, 5: 25}
+            "squares": MappingProxyType({2: 4, 3: 9, 4: 16, 5: 25})
+        })
+        self._squares = squares = self.knowledge["squares"]
+        self._math_explanations = {n: f"{n} squared equals {sq}" for n, sq in squares.items()}
+        
+        # Answer lookup table for invoke_many(): index = number, value = answer text.
+        # Mirrors _answer_math, including the deliberately wrong answer for 4.
+        self._squares_lut = np.array([
+            "15" if n == 4 else str(squares[n]) if n in squares else _UNKNOWN["answer"]
+            for n in range(max(squares) + 1)
+        ])
+        
+        # One handler per question type: a dict lookup instead of an if/elif chain
+        self._dispatch = {
+            "capital": self._answer_capital,
+            "planet": lambda **kwargs: _LARGEST_PLANET,
+            "python": lambda **kwargs: _PYTHON_CREATOR,
+            "math": self._answer_math,
         }
     
-    def invoke(self, question_type: str, **kwargs) -> dict:
+    def invoke(self, question_type: str, **kwargs) -> Mapping[str, str]:
         """Answer different types of questions with varying accuracy."""
+        return self._dispatch.get(question_type, self._answer_unknown)(**kwargs)
+    
+    def invoke_many(self, numbers) -> np.ndarray:
+        """
+        Answer many "math" questions at once, returning only the answer strings.
         
-        if question_type == "capital":
-            country = kwargs.get("country", "").lower()
-            if country == "france":
-                return {
-                    "answer": "Paris",
-                    "confidence": "high",
-                    "explanation": "Paris is the capital and largest city of France"
-                }
-        
-        elif question_type == "planet":
-            return {
-                "answer": "Jupiter",
-                "confidence": "high", 
-                "explanation": "Jupiter is the largest planet in our solar system"
-            }
-        
-        elif question_type == "python":
-            return {
-                "answer": "Guido van Rossum",
-                "confidence": "medium",
-                "explanation": "The creator of Python programming language"
-            }
+        Useful when the same question is asked for many iterations: one NumPy
+        gather replaces a Python-level invoke() per number.
+        """
+        numbers = np.asarray(numbers, dtype=np.int64)
+        answers = np.full(numbers.shape, _UNKNOWN["answer"], dtype=self._squares_lut.dtype)
+        known = (numbers >= 0) & (numbers < self._squares_lut.size)
+        answers[known] = self._squares_lut[numbers[known]]
+        return answers
+    
+    def math_batch(self, numbers) -> np.ndarray:
+        """
+        Numeric answers to many "math" questions, as an int64 array.
         
-        elif question_type == "math":
-            number = kwargs.get("number", 0)
-            if number in self.knowledge["squares"]:
-                correct_answer = self.knowledge["squares"][number]
-                # Simulate sometimes giving close but wrong answers
-                if number == 4:  # Deliberately wrong for demonstration
-                    return {
-                        "answer": "15",  # Wrong! Should be 16
-                        "confidence": "medium",
-                        "explanation": f"I think {number} squared is 15"
-                    }
-                else:
-                    return {
-                        "answer": str(correct_answer),
-                        "confidence": "high",
-                        "explanation": f"{number} squared equals {correct_answer}"
-                    }
+        Unlike invoke(), this squares any integer (not just the knowledge base
+        entries); 4 still gets the deliberately wrong 15. Large batches run through
+        the numba-compiled kernel when numba is installed.
+        """
+        nums = np.ascontiguousarray(numbers, dtype=np.int64)
+        out = np.empty_like(nums)
+        kernel = _get_jit_squares_kernel() if nums.size >= _JIT_MIN_BATCH else None
+        if kernel is not None:
+            kernel(nums.ravel(), out.ravel())
+        else:
+            np.multiply(nums, nums, out=out)
+            out[nums == 4] = 15
+        return out
+    
+    def _answer_capital(self, country: str = "", **kwargs) -> Mapping[str, str]:
+        if country == "france" or country.lower() == "france":
+            return _CAPITAL_FRANCE
+        return _UNKNOWN
+    
+    def _answer_math(self, number: int = 0, **kwargs) -> Mapping[str, str]:
+        correct_answer = self._squares.get(number)
+        if correct_answer is None:
+            return _UNKNOWN
         
-        # Default fallback
+        # Simulate sometimes giving close but wrong answers
+        if number == 4:  # Deliberately wrong for demonstration
+            return _MATH_WRONG_4
         return {
-            "answer": "I don't know",
-            "confidence": "none",
-            "explanation": "This question is outside my knowledge base"
+            "answer": str(correct_answer),
+            "confidence": "high",
+            "explanation": self._math_explanations[number]
         }
+    
+    def _answer_unknown(self, **kwargs) -> Mapping[str, str]:
+        # Default fallback
+        return _UNKNOWN
 
 
+@lru_cache(maxsize=None)
 def create_quiz_agent():
-    """Factory function for the quiz agent."""
+    """Factory function for the quiz agent (stateless, so one instance is shared)."""
     return QuizAgent()
 
 
@@ -168,16 +275,6 @@ def main():
         )
     ]
     
-    # Run boolean evaluation
-    bool_benchmarker = OmniBarmarker(
-        executor_fn=create_quiz_agent,
-        executor_kwargs={},
-        initial_input=bool_benchmarks
-    )
-    
-    results = bool_benchmarker.benchmark()
-    bool_benchmarker.print_logger_summary()
-    
     # =============================================================================
     # Example 2: FloatEvalResult - Scored Evaluation (Simulated)
     # =============================================================================
@@ -226,15 +323,19 @@ def main():
         )
     ]
     
-    # Run scored evaluation
-    float_benchmarker = OmniBarmarker(
+    # =============================================================================
+    # Run both examples in one benchmarker (same agent, one setup)
+    # =============================================================================
+    print("\n🚀 Running boolean and scored benchmarks together...")
+    
+    quiz_benchmarker = OmniBarmarker(
         executor_fn=create_quiz_agent,
         executor_kwargs={},
-        initial_input=float_benchmarks
+        initial_input=bool_benchmarks + float_benchmarks
     )
     
-    results = float_benchmarker.benchmark()
-    float_benchmarker.print_logger_summary()
+    results = quiz_benchmarker.benchmark()
+    quiz_benchmarker.print_logger_summary()
     
     # =============================================================================
     # Example 3: Comparison and Use Cases
@@ -273,4 +374,13 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    if os.environ.get("BENCH_QUIET"):
+        # Buffer the output and write it once at the end (for repeated CI runs)
+        buffer = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(buffer):
+                main()
+        finally:
+            sys.stdout.write(buffer.getvalue())
+    else:
+        main()
@@ -5,6 +5,7 @@ This package contains reusable components for inventory management:
 - models: Core dataclasses (Item, Warehouse, Showroom, ShipmentRequest)
 - schemas: Pydantic validation schemas for state validation
 - utils: Helper functions and schema creation utilities
+- metrics: Summary math over the array view of a system state
 
 These components can be easily imported and reused in Jupyter notebooks or other examples.
 """
@@ -19,6 +20,9 @@ from .schemas import (
     ShipmentRequestStateSchema,
     SystemSummarySchema,
     InventorySystemStateSchema,
+    InventorySystemStateArrays,
+    to_arrays,
+    build_state,
     ComplexMultiLocationFinalState
 )
 from .utils import (
@@ -29,7 +33,8 @@ from .utils import (
     convert_showroom_to_state_schema,
     convert_shipment_request_to_state_schema,
     create_complete_system_state_dict,
-    create_complex_multi_location_state_dict
+    create_complex_multi_location_state_dict,
+    dump_state_json
 )
 
 __all__ = [
@@ -47,6 +52,9 @@ __all__ = [
     'ShipmentRequestStateSchema',
     'SystemSummarySchema',
     'InventorySystemStateSchema',
+    'InventorySystemStateArrays',
+    'to_arrays',
+    'build_state',
     'ComplexMultiLocationFinalState',
     
     # Utils
@@ -57,5 +65,6 @@ __all__ = [
     'convert_showroom_to_state_schema',
     'convert_shipment_request_to_state_schema',
     'create_complete_system_state_dict',
-    'create_complex_multi_location_state_dict'
+    'create_complex_multi_location_state_dict',
+    'dump_state_json'
 ]
@@ -0,0 +1,66 @@
+"""
+Aggregate metrics over inventory system state arrays.
+
+This module contains the summary math (totals and utilization) over the
+column view produced by schemas.to_arrays, for code that summarizes many
+state snapshots.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+# Below this many locations the NumPy reductions are already cheaper than a
+# call into the compiled kernel
+_JIT_MIN_LOCATIONS = 256
+
+
+def _summary_kernel(current_quantity, capacity):
+    total_items = 0
+    total_capacity = 0
+    for i in range(current_quantity.shape[0]):
+        total_items += current_quantity[i]
+        total_capacity += capacity[i]
+    utilization = total_items / total_capacity if total_capacity > 0 else 0.0
+    return total_items, total_capacity, utilization
+
+
+# numba-compiled _summary_kernel: None until first needed, False without numba
+_jit_summary_kernel = None
+
+
+def _get_jit_summary_kernel():
+    """
+    Return the compiled summary kernel, or None when numba isn't installed.
+
+    numba is imported and the kernel compiled on the first summary large enough
+    to use it, so importing this module (or the extras package) stays cheap.
+    """
+    global _jit_summary_kernel
+    if _jit_summary_kernel is None:
+        try:
+            from numba import njit
+        except ImportError:  # numba is optional; compute_summary falls back to NumPy
+            _jit_summary_kernel = False
+        else:
+            _jit_summary_kernel = njit(cache=True)(_summary_kernel)
+    return _jit_summary_kernel or None
+
+
+def compute_summary(current_quantity: np.ndarray, capacity: np.ndarray) -> Tuple[int, int, float]:
+    """
+    Return (total_items, total_capacity, utilization) for per-location columns.
+
+    Utilization is rounded to 4 places like SystemSummarySchema.overall_utilization_rate.
+    Uses the numba-compiled kernel for large inputs when numba is installed.
+    """
+    current_quantity = np.ascontiguousarray(current_quantity, dtype=np.int64)
+    capacity = np.ascontiguousarray(capacity, dtype=np.int64)
+    kernel = _get_jit_summary_kernel() if current_quantity.size >= _JIT_MIN_LOCATIONS else None
+    if kernel is not None:
+        total_items, total_capacity, utilization = kernel(current_quantity, capacity)
+    else:
+        total_items = current_quantity.sum()
+        total_capacity = capacity.sum()
+        utilization = total_items / total_capacity if total_capacity > 0 else 0.0
+    return int(total_items), int(total_capacity), round(float(utilization), 4)
@@ -5,12 +5,13 @@ This module contains the fundamental data structures used throughout the
 inventory management system, including items, warehouses, showrooms, and shipment requests.
 """
 
-from typing import Dict, Optional
-from dataclasses import dataclass, field
+from typing import Dict, Mapping, Optional
+from dataclasses import InitVar, dataclass, field
 from datetime import datetime
+from types import MappingProxyType
 
 
-@dataclass
+@dataclass(slots=True)
 class Item:
     """Represents an inventory item."""
     item_id: str
@@ -25,24 +26,94 @@ class Item:
             self.expiry_date = datetime.fromisoformat(self.expiry_date)
 
 
-@dataclass
-class Warehouse:
+class _ItemStorage:
+    """
+    Item storage shared by warehouses and showrooms.
+
+    Keeps a running total of the stored quantity so ``current_quantity`` and
+    ``available_capacity`` don't re-sum every item. To keep that total right,
+    ``items`` is a read-only view: change stock through ``add_item``,
+    ``remove_quantity`` and ``clear_items``. The view still hands out the
+    stored ``Item`` objects themselves, and ``add_item`` stores the item it is
+    given; setting ``quantity`` on either directly desyncs the total.
+    """
+    __slots__ = ()
+
+    @property
+    def items(self) -> Mapping[str, Item]:
+        """Read-only view of the stored items, keyed by item id."""
+        return MappingProxyType(self._items)
+
+    @property
+    def current_quantity(self) -> int:
+        """Get total quantity of items stored here."""
+        return self._current_qty
+
+    @property
+    def available_capacity(self) -> int:
+        """Get remaining capacity."""
+        return max(0, self.capacity - self._current_qty)
+
+    @property
+    def utilization_rate(self) -> float:
+        """Get the fraction of capacity in use (0.0 for a zero-capacity location)."""
+        return self._current_qty / self.capacity if self.capacity > 0 else 0.0
+
+    def add_item(self, item: Item) -> Item:
+        """Store an item, or add its quantity to the stored item with the same id."""
+        stored = self._items.get(item.item_id)
+        if stored is None:
+            self._items[item.item_id] = stored = item
+        else:
+            stored.quantity += item.quantity
+        self._current_qty += item.quantity
+        return stored
+
+    def remove_quantity(self, item_id: str, quantity: int) -> Item:
+        """Take ``quantity`` of an item out, dropping the item once none is left."""
+        item = self._items[item_id]
+        if quantity > item.quantity:
+            raise ValueError(f"Cannot remove {quantity} of {item_id}: only {item.quantity} stored")
+        item.quantity -= quantity
+        self._current_qty -= quantity
+        if item.quantity <= 0:
+            del self._items[item_id]
+        return item
+
+    def clear_items(self) -> None:
+        """Remove all stored items."""
+        self._items.clear()
+        self._current_qty = 0
+
+    def __post_init__(self, items: Optional[Mapping[str, Item]]) -> None:
+        # Seed stock passed to the constructor through add_item so the total counts it
+        if items:
+            for item in items.values():
+                self.add_item(item)
+
+
+def _item_storage(cls):
+    """
+    Make an _ItemStorage subclass a slotted dataclass.
+
+    The dataclass leaves the ``items`` InitVar's default on the class, where it
+    would hide the inherited read-only ``items`` view, so it is removed again.
+    """
+    cls = dataclass(slots=True)(cls)
+    del cls.items
+    return cls
+
+
+@_item_storage
+class Warehouse(_ItemStorage):
     """Represents a warehouse with direct item storage and capacity."""
     warehouse_id: str
     name: str
     location: str
     capacity: int
-    items: Dict[str, Item] = field(default_factory=dict)
-    
-    @property
-    def current_quantity(self) -> int:
-        """Get total quantity of items in this warehouse."""
-        return sum(item.quantity for item in self.items.values())
-    
-    @property
-    def available_capacity(self) -> int:
-        """Get remaining capacity in this warehouse."""
-        return max(0, self.capacity - self.current_quantity)
+    items: InitVar[Optional[Mapping[str, Item]]] = None
+    _items: Dict[str, Item] = field(default_factory=dict, init=False)
+    _current_qty: int = field(default=0, init=False)
     
     def get_total_capacity(self) -> int:
         """Get total capacity of this warehouse."""
@@ -53,28 +124,20 @@ class Warehouse:
         return self.current_quantity
 
 
-@dataclass
-class Showroom:
+@_item_storage
+class Showroom(_ItemStorage):
     """Represents a showroom associated with a specific warehouse."""
     showroom_id: str
     name: str
     location: str
     associated_warehouse_id: str
     capacity: int
-    items: Dict[str, Item] = field(default_factory=dict)
-    
-    @property
-    def current_quantity(self) -> int:
-        """Get total quantity of items in this showroom."""
-        return sum(item.quantity for item in self.items.values())
-    
-    @property
-    def available_capacity(self) -> int:
-        """Get remaining capacity in this showroom."""
-        return max(0, self.capacity - self.current_quantity)
+    items: InitVar[Optional[Mapping[str, Item]]] = None
+    _items: Dict[str, Item] = field(default_factory=dict, init=False)
+    _current_qty: int = field(default=0, init=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class ShipmentRequest:
     """Represents a shipment request."""
     request_id: str
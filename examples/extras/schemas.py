@@ -5,29 +5,89 @@ This module contains comprehensive pydantic schemas for validating the final sta
 of inventory operations, including tailored schemas for specific operation types.
 """
 
-from typing import Dict, Any, List, Optional
-from datetime import datetime
-from pydantic import BaseModel, Field, field_validator, model_validator
+import os
+import sys
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+from operator import attrgetter
+from typing import Annotated, Dict, Any, Literal, Optional, Tuple
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, computed_field, field_validator, model_validator
+from pydantic.dataclasses import dataclass as pydantic_dataclass
+from pydantic_core import ArgsKwargs
 
-# Import the core models for type references
-from .models import Item, Warehouse, Showroom, ShipmentRequest
 
+_get_quantity = attrgetter('quantity')
 
-class ItemStateSchema(BaseModel):
+
+# Field descriptions only matter for generated JSON schemas/docs; pydantic keeps
+# them on every FieldInfo and core schema, so they are left out unless
+# OMNIBAR_SCHEMA_DOCS=1
+_INCLUDE_DESCRIPTIONS = bool(int(os.getenv("OMNIBAR_SCHEMA_DOCS", "0")))
+
+
+def _describe(text: str) -> Dict[str, str]:
+    return {"description": text} if _INCLUDE_DESCRIPTIONS else {}
+
+
+@lru_cache(maxsize=4096)
+def _normalize_id(value: str) -> str:
+    """
+    Canonical (stripped, uppercased) form of an ID; empty for blank input.
+
+    IDs come from a small set (ITEM001, WH001, SR001, ...), so results are cached
+    and interned: repeated IDs skip the string work and share one object.
+    """
+    return sys.intern(value.strip().upper())
+
+
+def _drop_computed_input(data: Any, name: str) -> Any:
+    """
+    Remove a computed field's key from raw input before validation.
+
+    Computed fields appear in model_dump() output, so accepting (and ignoring)
+    them on input keeps dumps re-validatable under extra="forbid". Handles dict
+    input and the ArgsKwargs pydantic dataclasses receive from their constructor.
+    """
+    if isinstance(data, dict) and name in data:
+        return {key: value for key, value in data.items() if key != name}
+    if isinstance(data, ArgsKwargs) and data.kwargs and name in data.kwargs:
+        kwargs = {key: value for key, value in data.kwargs.items() if key != name}
+        return ArgsKwargs(data.args, kwargs)
+    return data
+
+
+# Enum-like string fields; pydantic-core checks Literal membership itself
+_OperationalStatus = Literal["active", "maintenance", "closed", "pending"]
+_ShowroomType = Literal["retail", "demo", "exhibition", "private"]
+_ShipmentStatus = Literal["pending", "approved", "shipped", "delivered", "cancelled"]
+_SystemStatus = Literal["operational", "maintenance", "emergency", "offline"]
+_OperationType = Literal[
+    "transfer_warehouse", "move_to_showroom", "request_shipment",
+    "receive_shipment", "get_status", "system_check"
+]
+
+
+# Leaf schemas below are slotted pydantic dataclasses rather than BaseModels: a
+# location can hold many items (and a system many requests), and slotted
+# instances carry no per-instance __dict__
+@pydantic_dataclass(slots=True, frozen=True, config=ConfigDict(extra="forbid"))
+class ItemStateSchema:
     """Schema representing the final state of an inventory item."""
-    item_id: str = Field(..., description="Unique identifier for the item")
-    name: str = Field(..., description="Display name of the item")
-    quantity: int = Field(..., ge=0, description="Current quantity of the item")
-    unit_price: float = Field(default=0.0, ge=0, description="Unit price of the item in dollars")
-    category: str = Field(default="general", description="Item category classification")
-    expiry_date: Optional[str] = Field(default=None, description="Item expiry date in ISO format")
+    item_id: str = Field(..., **_describe("Unique identifier for the item"))
+    name: str = Field(..., **_describe("Display name of the item"))
+    quantity: int = Field(..., ge=0, **_describe("Current quantity of the item"))
+    unit_price: float = Field(default=0.0, ge=0, **_describe("Unit price of the item in dollars"))
+    category: str = Field(default="general", **_describe("Item category classification"))
+    expiry_date: Optional[str] = Field(default=None, **_describe("Item expiry date in ISO format"))
     
     @field_validator('item_id')
     @classmethod
     def validate_item_id(cls, v):
-        if not v or not v.strip():
+        normalized = _normalize_id(v)
+        if not normalized:
             raise ValueError('item_id cannot be empty')
-        return v.strip().upper()
+        return normalized
     
     @field_validator('name')
     @classmethod
@@ -35,31 +95,30 @@ class ItemStateSchema(BaseModel):
         if not v or not v.strip():
             raise ValueError('item name cannot be empty')
         return v.strip()
-    
-    class Config:
-        extra = "forbid"
-        json_encoders = {
-            datetime: lambda dt: dt.isoformat() if dt else None
-        }
 
 
 class LocationStateSchema(BaseModel):
     """Schema representing a storage location (warehouse or showroom)."""
-    location_id: str = Field(..., description="Unique identifier for the location")
-    name: str = Field(..., description="Display name of the location")
-    location_address: str = Field(..., description="Physical address of the location")
-    capacity: int = Field(..., gt=0, description="Maximum storage capacity")
-    current_quantity: int = Field(..., ge=0, description="Current total items stored")
-    available_capacity: int = Field(..., ge=0, description="Remaining storage capacity")
-    utilization_rate: float = Field(..., ge=0.0, le=1.0, description="Capacity utilization rate (0.0-1.0)")
-    items: Dict[str, ItemStateSchema] = Field(default_factory=dict, description="Items currently stored")
+    location_id: str = Field(..., **_describe("Unique identifier for the location"))
+    name: str = Field(..., **_describe("Display name of the location"))
+    location_address: str = Field(..., **_describe("Physical address of the location"))
+    capacity: int = Field(..., gt=0, **_describe("Maximum storage capacity"))
+    current_quantity: int = Field(..., ge=0, **_describe("Current total items stored"))
+    available_capacity: int = Field(..., ge=0, **_describe("Remaining storage capacity"))
+    items: Dict[str, ItemStateSchema] = Field(default_factory=dict, **_describe("Items currently stored"))
         
+    @model_validator(mode='before')
+    @classmethod
+    def drop_utilization_rate(cls, data):
+        return _drop_computed_input(data, 'utilization_rate')
+    
     @field_validator('location_id')
     @classmethod
     def validate_location_id(cls, v):
-        if not v or not v.strip():
+        normalized = _normalize_id(v)
+        if not normalized:
             raise ValueError('location_id cannot be empty')
-        return v.strip().upper()
+        return normalized
         
     @model_validator(mode='after')
     def validate_capacity_consistency(self):
@@ -73,100 +132,66 @@ class LocationStateSchema(BaseModel):
         if current_quantity < 0 or available_capacity < 0:
             raise ValueError('quantities cannot be negative')
         
-        # Calculate utilization rate
-        utilization_rate = current_quantity / capacity if capacity > 0 else 0.0
-        self.utilization_rate = round(utilization_rate, 4)
-        
-        return self
-        
-    @model_validator(mode='after')
-    def validate_items_quantity_consistency(self):
-        items = self.items
-        current_quantity = self.current_quantity
-        
-        calculated_quantity = sum(item.quantity for item in items.values())
+        # Stored items must add up to current_quantity
+        calculated_quantity = sum(map(_get_quantity, self.items.values()))
         if calculated_quantity != current_quantity:
             raise ValueError(f'Sum of item quantities ({calculated_quantity}) must match current_quantity ({current_quantity})')
         
         return self
     
-    class Config:
-        extra = "forbid"
+    @computed_field(**_describe("Capacity utilization rate (0.0-1.0)"))
+    @cached_property
+    def utilization_rate(self) -> float:
+        return round(self.current_quantity / self.capacity, 4) if self.capacity else 0.0
+    
+    model_config = ConfigDict(extra="forbid")
 
 
 class WarehouseStateSchema(LocationStateSchema):
     """Schema representing the final state of a warehouse."""
-    warehouse_type: str = Field(default="distribution", description="Type of warehouse (distribution, storage, etc.)")
-    operational_status: str = Field(default="active", description="Operational status (active, maintenance, closed)")
-    
-    @field_validator('operational_status')
-    @classmethod
-    def validate_operational_status(cls, v):
-        valid_statuses = ["active", "maintenance", "closed", "pending"]
-        if v not in valid_statuses:
-            raise ValueError(f'operational_status must be one of: {valid_statuses}')
-        return v
+    warehouse_type: str = Field(default="distribution", **_describe("Type of warehouse (distribution, storage, etc.)"))
+    operational_status: _OperationalStatus = Field(default="active", **_describe("Operational status (active, maintenance, closed)"))
 
 
 class ShowroomStateSchema(LocationStateSchema):
     """Schema representing the final state of a showroom."""
-    associated_warehouse_id: str = Field(..., description="ID of the associated warehouse")
-    showroom_type: str = Field(default="retail", description="Type of showroom (retail, demo, exhibition)")
-    public_access: bool = Field(default=True, description="Whether showroom is accessible to public")
+    associated_warehouse_id: str = Field(..., **_describe("ID of the associated warehouse"))
+    showroom_type: _ShowroomType = Field(default="retail", **_describe("Type of showroom (retail, demo, exhibition)"))
+    public_access: bool = Field(default=True, **_describe("Whether showroom is accessible to public"))
     
     @field_validator('associated_warehouse_id')
     @classmethod
     def validate_associated_warehouse_id(cls, v):
-        if not v or not v.strip():
+        normalized = _normalize_id(v)
+        if not normalized:
             raise ValueError('associated_warehouse_id cannot be empty')
-        return v.strip().upper()
-    
-    @field_validator('showroom_type')
-    @classmethod
-    def validate_showroom_type(cls, v):
-        valid_types = ["retail", "demo", "exhibition", "private"]
-        if v not in valid_types:
-            raise ValueError(f'showroom_type must be one of: {valid_types}')
-        return v
+        return normalized
 
 
-class ShipmentRequestStateSchema(BaseModel):
+@pydantic_dataclass(slots=True, frozen=True, config=ConfigDict(extra="forbid"))
+class ShipmentRequestStateSchema:
     """Schema representing the state of a shipment request."""
-    request_id: str = Field(..., description="Unique identifier for the shipment request")
-    item_requests: Dict[str, int] = Field(..., description="Items requested with quantities")
-    destination_warehouse: str = Field(..., description="Target warehouse for delivery")
-    requested_date: str = Field(..., description="Requested delivery date in ISO format")
-    status: str = Field(..., description="Current status of the request")
-    
-    @field_validator('status')
-    @classmethod
-    def validate_status(cls, v):
-        valid_statuses = ["pending", "approved", "shipped", "delivered", "cancelled"]
-        if v not in valid_statuses:
-            raise ValueError(f'status must be one of: {valid_statuses}')
-        return v
-    
-    @field_validator('item_requests')
-    @classmethod
-    def validate_item_requests(cls, v):
-        if not v:
-            raise ValueError('item_requests cannot be empty')
-        for item_id, quantity in v.items():
-            if quantity <= 0:
-                raise ValueError(f'quantity for item {item_id} must be positive')
-        return v
-    
-    class Config:
-        extra = "forbid"
+    request_id: str = Field(..., **_describe("Unique identifier for the shipment request"))
+    item_requests: Dict[str, Annotated[int, Field(gt=0)]] = Field(
+        ..., min_length=1, **_describe("Items requested with (positive) quantities")
+    )
+    destination_warehouse: str = Field(..., **_describe("Target warehouse for delivery"))
+    requested_date: str = Field(..., **_describe("Requested delivery date in ISO format"))
+    status: _ShipmentStatus = Field(..., **_describe("Current status of the request"))
 
 
-class SystemSummarySchema(BaseModel):
+@pydantic_dataclass(slots=True, frozen=True, config=ConfigDict(extra="forbid"))
+class SystemSummarySchema:
     """Schema representing summary statistics of the inventory system."""
-    total_items: int = Field(..., ge=0, description="Total items across all locations")
-    total_capacity: int = Field(..., gt=0, description="Total storage capacity across all locations")
-    total_available_capacity: int = Field(..., ge=0, description="Total available storage capacity")
-    overall_utilization_rate: float = Field(..., ge=0.0, le=1.0, description="System-wide utilization rate")
-    total_value: float = Field(default=0.0, ge=0, description="Total monetary value of inventory")
+    total_items: int = Field(..., ge=0, **_describe("Total items across all locations"))
+    total_capacity: int = Field(..., gt=0, **_describe("Total storage capacity across all locations"))
+    total_available_capacity: int = Field(..., ge=0, **_describe("Total available storage capacity"))
+    total_value: float = Field(default=0.0, ge=0, **_describe("Total monetary value of inventory"))
+    
+    @model_validator(mode='before')
+    @classmethod
+    def drop_overall_utilization_rate(cls, data):
+        return _drop_computed_input(data, 'overall_utilization_rate')
     
     @model_validator(mode='after')
     def validate_summary_consistency(self):
@@ -177,49 +202,56 @@ class SystemSummarySchema(BaseModel):
         if total_items + total_available > total_capacity:
             raise ValueError('total_items + total_available_capacity cannot exceed total_capacity')
         
-        utilization = total_items / total_capacity if total_capacity > 0 else 0.0
-        self.overall_utilization_rate = round(utilization, 4)
-        
         return self
     
-    class Config:
-        extra = "forbid"
+    # Plain property: slotted instances have no __dict__ for cached_property
+    @computed_field(**_describe("System-wide utilization rate"))
+    @property
+    def overall_utilization_rate(self) -> float:
+        return round(self.total_items / self.total_capacity, 4) if self.total_capacity else 0.0
+
+
+# Validate a whole {location_id: raw dict} mapping in one pydantic-core call,
+# e.g. _WAREHOUSES_ADAPTER.validate_python(raw), rather than constructing
+# WarehouseStateSchema(**data) per entry
+_WAREHOUSES_ADAPTER = TypeAdapter(Dict[str, WarehouseStateSchema])
+_SHOWROOMS_ADAPTER = TypeAdapter(Dict[str, ShowroomStateSchema])
 
 
 class InventorySystemStateSchema(BaseModel):
     """Comprehensive schema representing the complete final state of the inventory management system."""
-    system_id: str = Field(default="INVENTORY_SYS_001", description="Unique system identifier")
-    timestamp: str = Field(..., description="Timestamp of state capture in ISO format")
-    total_warehouses: int = Field(..., ge=0, description="Total number of warehouses")
-    total_showrooms: int = Field(..., ge=0, description="Total number of showrooms")
-    warehouses: Dict[str, WarehouseStateSchema] = Field(..., description="Complete state of all warehouses")
-    showrooms: Dict[str, ShowroomStateSchema] = Field(..., description="Complete state of all showrooms")
+    system_id: str = Field(default="INVENTORY_SYS_001", **_describe("Unique system identifier"))
+    timestamp: str = Field(..., **_describe("Timestamp of state capture in ISO format"))
+    total_warehouses: int = Field(..., ge=0, **_describe("Total number of warehouses"))
+    total_showrooms: int = Field(..., ge=0, **_describe("Total number of showrooms"))
+    warehouses: Dict[str, WarehouseStateSchema] = Field(..., **_describe("Complete state of all warehouses"))
+    showrooms: Dict[str, ShowroomStateSchema] = Field(..., **_describe("Complete state of all showrooms"))
     active_shipment_requests: Dict[str, ShipmentRequestStateSchema] = Field(
         default_factory=dict, 
-        description="Currently active shipment requests"
+        **_describe("Currently active shipment requests")
     )
-    summary: SystemSummarySchema = Field(..., description="System-wide summary statistics")
+    summary: SystemSummarySchema = Field(..., **_describe("System-wide summary statistics"))
     warehouse_associations: Dict[str, str] = Field(
         default_factory=dict,
-        description="Mapping of showroom_id to warehouse_id associations"
+        **_describe("Mapping of showroom_id to warehouse_id associations")
     )
-    system_status: str = Field(default="operational", description="Overall system operational status")
+    system_status: _SystemStatus = Field(default="operational", **_describe("Overall system operational status"))
     
-    @field_validator('system_status')
-    @classmethod
-    def validate_system_status(cls, v):
-        valid_statuses = ["operational", "maintenance", "emergency", "offline"]
-        if v not in valid_statuses:
-            raise ValueError(f'system_status must be one of: {valid_statuses}')
-        return v
     
     @model_validator(mode='after')
     def validate_warehouse_associations(self):
         warehouses = self.warehouses
         showrooms = self.showrooms
-        associations = {}
+        
+        # Validate counts
+        if len(warehouses) != self.total_warehouses:
+            raise ValueError('total_warehouses count does not match actual warehouses')
+        
+        if len(showrooms) != self.total_showrooms:
+            raise ValueError('total_showrooms count does not match actual showrooms')
         
         # Build warehouse associations from showroom data
+        associations = {}
         for showroom_id, showroom in showrooms.items():
             warehouse_id = showroom.associated_warehouse_id
             if warehouse_id not in warehouses:
@@ -229,199 +261,217 @@ class InventorySystemStateSchema(BaseModel):
         self.warehouse_associations = associations
         return self
     
-    @model_validator(mode='after')
-    def validate_system_totals(self):
-        warehouses = self.warehouses
-        showrooms = self.showrooms
-        
-        # Validate counts
-        if len(warehouses) != self.total_warehouses:
-            raise ValueError('total_warehouses count does not match actual warehouses')
-        
-        if len(showrooms) != self.total_showrooms:
-            raise ValueError('total_showrooms count does not match actual showrooms')
-        
-        return self
+    model_config = ConfigDict(extra="forbid")
+
+
+@dataclass(slots=True, frozen=True)
+class InventorySystemStateArrays:
+    """Column (structure-of-arrays) view of the locations in an inventory system state.
     
-    class Config:
-        extra = "forbid"
-        json_encoders = {
-            datetime: lambda dt: dt.isoformat()
-        }
+    Warehouses come first, then showrooms, in the state's dict order.
+    """
+    location_ids: np.ndarray
+    current_quantity: np.ndarray
+    capacity: np.ndarray
+    available_capacity: np.ndarray
+    
+    def totals(self):
+        """Return (total_items, total_capacity, total_available_capacity)."""
+        return (
+            int(self.current_quantity.sum()),
+            int(self.capacity.sum()),
+            int(self.available_capacity.sum()),
+        )
+
+
+def to_arrays(state: InventorySystemStateSchema) -> InventorySystemStateArrays:
+    """Pack the warehouses and showrooms of a validated state into parallel arrays."""
+    locations = [*state.warehouses.values(), *state.showrooms.values()]
+    count = len(locations)
+    
+    def column(name):
+        return np.fromiter(map(attrgetter(name), locations), dtype=np.int64, count=count)
+    
+    return InventorySystemStateArrays(
+        location_ids=np.array([location.location_id for location in locations], dtype=np.str_),
+        current_quantity=column('current_quantity'),
+        capacity=column('capacity'),
+        available_capacity=column('available_capacity'),
+    )
 
 
 class OperationResultStateSchema(BaseModel):
     """Schema representing the expected final state after an operation."""
-    success: bool = Field(..., description="Whether the operation succeeded")
-    operation_type: str = Field(..., description="Type of operation performed")
-    operation_id: str = Field(..., description="Unique identifier for the operation")
-    message: str = Field(..., description="Human-readable result message")
-    timestamp: str = Field(..., description="Operation completion timestamp in ISO format")
-    affected_locations: List[str] = Field(default_factory=list, description="List of location IDs affected by operation")
-    inventory_changes: Dict[str, Any] = Field(default_factory=dict, description="Summary of inventory changes made")
+    success: bool = Field(..., **_describe("Whether the operation succeeded"))
+    operation_type: _OperationType = Field(..., **_describe("Type of operation performed"))
+    operation_id: str = Field(..., **_describe("Unique identifier for the operation"))
+    message: str = Field(..., **_describe("Human-readable result message"))
+    timestamp: str = Field(..., **_describe("Operation completion timestamp in ISO format"))
+    affected_locations: Tuple[str, ...] = Field(default_factory=tuple, **_describe("Location IDs affected by operation"))
+    inventory_changes: Dict[str, Any] = Field(default_factory=dict, **_describe("Summary of inventory changes made"))
     final_system_state: Optional[InventorySystemStateSchema] = Field(
         default=None, 
-        description="Complete system state after operation"
+        **_describe("Complete system state after operation")
     )
     
-    @field_validator('operation_type')
+    
+    @field_validator('affected_locations')
     @classmethod
-    def validate_operation_type(cls, v):
-        valid_types = [
-            "transfer_warehouse", "move_to_showroom", "request_shipment", 
-            "receive_shipment", "get_status", "system_check"
-        ]
-        if v not in valid_types:
-            raise ValueError(f'operation_type must be one of: {valid_types}')
-        return v
+    def validate_affected_locations(cls, v):
+        # Same cached, interned IDs as the location schemas
+        return tuple(map(_normalize_id, v))
     
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid", revalidate_instances="never", frozen=True)
 
 
 # Tailored schemas for specific operation final states
 class WarehouseTransferFinalState(BaseModel):
     """Highly tailored schema for warehouse transfer operation final state."""
-    operation_type: str = Field(..., description="Must be 'transfer_warehouse'")
-    success: bool = Field(..., description="Transfer operation success status") 
-    from_warehouse: str = Field(..., description="Source warehouse ID")
-    to_warehouse: str = Field(..., description="Destination warehouse ID")
-    transferred_item_id: str = Field(..., description="ID of transferred item")
-    transferred_quantity: int = Field(..., gt=0, description="Quantity transferred")
+    operation_type: str = Field(..., **_describe("Must be 'transfer_warehouse'"))
+    success: bool = Field(..., **_describe("Transfer operation success status")) 
+    from_warehouse: str = Field(..., **_describe("Source warehouse ID"))
+    to_warehouse: str = Field(..., **_describe("Destination warehouse ID"))
+    transferred_item_id: str = Field(..., **_describe("ID of transferred item"))
+    transferred_quantity: int = Field(..., gt=0, **_describe("Quantity transferred"))
     
     # Specific warehouse states after transfer
-    source_warehouse_final_state: WarehouseStateSchema = Field(..., description="Final state of source warehouse")
-    destination_warehouse_final_state: WarehouseStateSchema = Field(..., description="Final state of destination warehouse") 
+    source_warehouse_final_state: WarehouseStateSchema = Field(..., **_describe("Final state of source warehouse"))
+    destination_warehouse_final_state: WarehouseStateSchema = Field(..., **_describe("Final state of destination warehouse")) 
     
     # System-wide impact
-    total_system_items: int = Field(..., ge=0, description="Total items in system unchanged")
-    operation_timestamp: str = Field(..., description="When transfer completed")
+    total_system_items: int = Field(..., ge=0, **_describe("Total items in system unchanged"))
+    operation_timestamp: str = Field(..., **_describe("When transfer completed"))
     
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid", revalidate_instances="never", frozen=True)
 
 
 class ShowroomMoveFinalState(BaseModel):
     """Highly tailored schema for warehouse-to-showroom move operation final state."""
-    operation_type: str = Field(..., description="Must be 'move_to_showroom'")
-    success: bool = Field(..., description="Move operation success status")
-    source_warehouse_id: str = Field(..., description="Source warehouse ID")
-    destination_showroom_id: str = Field(..., description="Destination showroom ID")
-    moved_item_id: str = Field(..., description="ID of moved item")
-    moved_quantity: int = Field(..., gt=0, description="Quantity moved from warehouse")
+    operation_type: str = Field(..., **_describe("Must be 'move_to_showroom'"))
+    success: bool = Field(..., **_describe("Move operation success status"))
+    source_warehouse_id: str = Field(..., **_describe("Source warehouse ID"))
+    destination_showroom_id: str = Field(..., **_describe("Destination showroom ID"))
+    moved_item_id: str = Field(..., **_describe("ID of moved item"))
+    moved_quantity: int = Field(..., gt=0, **_describe("Quantity moved from warehouse"))
     
     # Verify warehouse-showroom association
-    warehouse_showroom_association_valid: bool = Field(..., description="Showroom must be associated with warehouse")
+    warehouse_showroom_association_valid: bool = Field(..., **_describe("Showroom must be associated with warehouse"))
     
     # Final states after move
-    warehouse_final_state: WarehouseStateSchema = Field(..., description="Warehouse state after item removal")
-    showroom_final_state: ShowroomStateSchema = Field(..., description="Showroom state after item addition")
+    warehouse_final_state: WarehouseStateSchema = Field(..., **_describe("Warehouse state after item removal"))
+    showroom_final_state: ShowroomStateSchema = Field(..., **_describe("Showroom state after item addition"))
     
     # Item completely removed from warehouse inventory
-    item_removed_from_warehouse: bool = Field(..., description="Item quantity reduced/removed from warehouse")
-    item_added_to_showroom: bool = Field(..., description="Item quantity added to showroom")
+    item_removed_from_warehouse: bool = Field(..., **_describe("Item quantity reduced/removed from warehouse"))
+    item_added_to_showroom: bool = Field(..., **_describe("Item quantity added to showroom"))
     
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid", revalidate_instances="never", frozen=True)
+
+
+def validate_business_scenario(state) -> None:
+    """
+    Check the laptop fulfillment requirements of a business scenario final state.
+
+    Works on any object exposing the BusinessScenarioFinalState attributes, so
+    hot paths that already hold trusted values can run the checks without
+    building the pydantic model.
+    """
+    # Nothing to check for failed scenarios
+    if not state.success:
+        return
+    
+    # Validate exact quantities based on business scenario
+    # Must have exactly 5 laptops remaining in WH001 after moving 10 to SR001
+    if state.wh001_laptop_quantity != 5:
+        raise ValueError(f"WH001 must have exactly 5 laptops remaining, found {state.wh001_laptop_quantity}")
+    
+    # Must have exactly 10 laptops in SR001 after move
+    if state.sr001_laptop_quantity != 10:
+        raise ValueError(f"SR001 must have exactly 10 laptops, found {state.sr001_laptop_quantity}")
+    
+    # Total system laptops must be exactly 15 (5 in WH001 + 10 in SR001)
+    if state.total_system_laptops != 15:
+        raise ValueError(f"System must have exactly 15 total laptops, found {state.total_system_laptops}")
+    
+    # Warehouse association must be correct
+    if not state.sr001_associated_with_wh001:
+        raise ValueError("SR001 must be associated with WH001")
+    
+    # Other warehouses/showrooms must remain empty
+    if not (state.wh002_empty and state.wh003_empty and state.sr002_empty and state.sr003_empty):
+        raise ValueError("WH002, WH003, SR002, SR003 must all remain empty")
+    
+    if state.wh001_has_laptops:
+        # Validate WH001 has the correct laptop item
+        wh001_items = state.wh001_final_state.items
+        if state.laptop_item_id not in wh001_items:
+            raise ValueError(f"WH001 must contain {state.laptop_item_id}")
+    
+        laptop_item = wh001_items[state.laptop_item_id]
+        if laptop_item.name != state.laptop_item_name:
+            raise ValueError(f"Laptop name must be '{state.laptop_item_name}', found '{laptop_item.name}'")
+    
+        if laptop_item.category != state.laptop_category:
+            raise ValueError(f"Laptop category must be '{state.laptop_category}', found '{laptop_item.category}'")
+    
+    if state.sr001_has_laptops:
+        # Validate SR001 has the correct laptop item
+        sr001_items = state.sr001_final_state.items
+        if state.laptop_item_id not in sr001_items:
+            raise ValueError(f"SR001 must contain {state.laptop_item_id}")
+    
+        laptop_item = sr001_items[state.laptop_item_id]
+        if laptop_item.name != state.laptop_item_name:
+            raise ValueError(f"Laptop name must be '{state.laptop_item_name}', found '{laptop_item.name}'")
 
 
 class BusinessScenarioFinalState(BaseModel):
     """Highly specific schema for complete laptop fulfillment business scenario validation."""
-    operation_type: str = Field(..., description="Must be 'business_scenario'")
-    success: bool = Field(..., description="Overall business scenario success status")
+    operation_type: str = Field(..., **_describe("Must be 'business_scenario'"))
+    success: bool = Field(..., **_describe("Overall business scenario success status"))
     
     # Specific business scenario validation
-    scenario_type: str = Field(default="laptop_fulfillment_to_manhattan", description="Type of business scenario")
+    scenario_type: str = Field(default="laptop_fulfillment_to_manhattan", **_describe("Type of business scenario"))
     
     # Warehouse WH001 (Manhattan) must contain exactly 5 remaining laptops
-    wh001_laptop_quantity: int = Field(..., ge=0, description="Exact laptop quantity remaining in WH001")
-    wh001_total_items: int = Field(..., ge=0, description="Total items in WH001")
-    wh001_has_laptops: bool = Field(..., description="WH001 must contain laptops (ITEM001)")
+    wh001_laptop_quantity: int = Field(..., ge=0, **_describe("Exact laptop quantity remaining in WH001"))
+    wh001_total_items: int = Field(..., ge=0, **_describe("Total items in WH001"))
+    wh001_has_laptops: bool = Field(..., **_describe("WH001 must contain laptops (ITEM001)"))
     
     # Showroom SR001 (Manhattan) must contain exactly 10 laptops
-    sr001_laptop_quantity: int = Field(..., description="Exact laptop quantity in SR001")
-    sr001_total_items: int = Field(..., ge=0, description="Total items in SR001") 
-    sr001_has_laptops: bool = Field(..., description="SR001 must contain laptops (ITEM001)")
+    sr001_laptop_quantity: int = Field(..., **_describe("Exact laptop quantity in SR001"))
+    sr001_total_items: int = Field(..., ge=0, **_describe("Total items in SR001")) 
+    sr001_has_laptops: bool = Field(..., **_describe("SR001 must contain laptops (ITEM001)"))
     
     # Association validation
-    sr001_associated_with_wh001: bool = Field(..., description="SR001 must be associated with WH001")
+    sr001_associated_with_wh001: bool = Field(..., **_describe("SR001 must be associated with WH001"))
     
     # System-wide laptop validation
-    total_system_laptops: int = Field(..., description="Total laptops in entire system")
-    total_system_items: int = Field(..., ge=0, description="Total items in entire system")
+    total_system_laptops: int = Field(..., **_describe("Total laptops in entire system"))
+    total_system_items: int = Field(..., ge=0, **_describe("Total items in entire system"))
     
     # Empty warehouse validation (WH002 and WH003 must remain empty)
-    wh002_empty: bool = Field(..., description="WH002 must remain empty")
-    wh003_empty: bool = Field(..., description="WH003 must remain empty")
-    sr002_empty: bool = Field(..., description="SR002 must remain empty")
-    sr003_empty: bool = Field(..., description="SR003 must remain empty")
+    wh002_empty: bool = Field(..., **_describe("WH002 must remain empty"))
+    wh003_empty: bool = Field(..., **_describe("WH003 must remain empty"))
+    sr002_empty: bool = Field(..., **_describe("SR002 must remain empty"))
+    sr003_empty: bool = Field(..., **_describe("SR003 must remain empty"))
     
     # Specific item validation
-    laptop_item_id: str = Field(default="ITEM001", description="Must be laptop item ID")
-    laptop_item_name: str = Field(default="Laptop Computer", description="Must be laptop name")
-    laptop_category: str = Field(default="electronics", description="Must be electronics category")
+    laptop_item_id: str = Field(default="ITEM001", **_describe("Must be laptop item ID"))
+    laptop_item_name: str = Field(default="Laptop Computer", **_describe("Must be laptop name"))
+    laptop_category: str = Field(default="electronics", **_describe("Must be electronics category"))
     
     # Final warehouse and showroom states for detailed validation
-    wh001_final_state: WarehouseStateSchema = Field(..., description="Final state of WH001")
-    sr001_final_state: ShowroomStateSchema = Field(..., description="Final state of SR001")
+    wh001_final_state: WarehouseStateSchema = Field(..., **_describe("Final state of WH001"))
+    sr001_final_state: ShowroomStateSchema = Field(..., **_describe("Final state of SR001"))
     
     @model_validator(mode='after')
     def validate_business_scenario_requirements(self):
-        """Validate specific business scenario requirements."""
-        # Validate exact quantities based on business scenario
-        if self.success:
-            # Must have exactly 5 laptops remaining in WH001 after moving 10 to SR001
-            if self.wh001_laptop_quantity != 5:
-                raise ValueError(f"WH001 must have exactly 5 laptops remaining, found {self.wh001_laptop_quantity}")
-            
-            # Must have exactly 10 laptops in SR001 after move
-            if self.sr001_laptop_quantity != 10:
-                raise ValueError(f"SR001 must have exactly 10 laptops, found {self.sr001_laptop_quantity}")
-            
-            # Total system laptops must be exactly 15 (5 in WH001 + 10 in SR001)
-            if self.total_system_laptops != 15:
-                raise ValueError(f"System must have exactly 15 total laptops, found {self.total_system_laptops}")
-            
-            # Warehouse association must be correct
-            if not self.sr001_associated_with_wh001:
-                raise ValueError("SR001 must be associated with WH001")
-            
-            # Other warehouses/showrooms must remain empty
-            if not (self.wh002_empty and self.wh003_empty and self.sr002_empty and self.sr003_empty):
-                raise ValueError("WH002, WH003, SR002, SR003 must all remain empty")
-        
-        return self
-    
-    @model_validator(mode='after') 
-    def validate_laptop_item_details(self):
-        """Validate laptop item has correct properties."""
-        if self.success and self.wh001_has_laptops:
-            # Validate WH001 has the correct laptop item
-            wh001_items = self.wh001_final_state.items
-            if self.laptop_item_id not in wh001_items:
-                raise ValueError(f"WH001 must contain {self.laptop_item_id}")
-            
-            laptop_item = wh001_items[self.laptop_item_id]
-            if laptop_item.name != self.laptop_item_name:
-                raise ValueError(f"Laptop name must be '{self.laptop_item_name}', found '{laptop_item.name}'")
-            
-            if laptop_item.category != self.laptop_category:
-                raise ValueError(f"Laptop category must be '{self.laptop_category}', found '{laptop_item.category}'")
-        
-        if self.success and self.sr001_has_laptops:
-            # Validate SR001 has the correct laptop item
-            sr001_items = self.sr001_final_state.items
-            if self.laptop_item_id not in sr001_items:
-                raise ValueError(f"SR001 must contain {self.laptop_item_id}")
-            
-            laptop_item = sr001_items[self.laptop_item_id]
-            if laptop_item.name != self.laptop_item_name:
-                raise ValueError(f"Laptop name must be '{self.laptop_item_name}', found '{laptop_item.name}'")
-        
+        """Validate specific business scenario requirements and laptop item details."""
+        validate_business_scenario(self)
         return self
     
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid", revalidate_instances="never", frozen=True)
 
 
 class ComplexMultiLocationFinalState(BaseModel):
@@ -433,45 +483,45 @@ class ComplexMultiLocationFinalState(BaseModel):
     """
     
     # Operation metadata
-    operation_type: str = Field(..., description="Must be 'complex_business_scenario'")
-    success: bool = Field(..., description="Overall crisis management success status")
+    operation_type: str = Field(..., **_describe("Must be 'complex_business_scenario'"))
+    success: bool = Field(..., **_describe("Overall crisis management success status"))
     
     # Scenario identification
-    scenario_type: str = Field(default="crisis_supply_chain_management", description="Type of crisis scenario")
+    scenario_type: str = Field(default="crisis_supply_chain_management", **_describe("Type of crisis scenario"))
     
     # Priority management validation
-    order_a_attempted: bool = Field(..., description="Order A (highest priority) was attempted first")
-    order_a_progress: float = Field(..., description="Progress on Order A (0.0-1.0)")
-    order_b_attempted: bool = Field(..., description="Order B attempted after Order A")
-    order_b_progress: float = Field(..., description="Progress on Order B (0.0-1.0)")
-    order_c_attempted: bool = Field(..., description="Order C (compliance) attempted")
-    order_c_progress: float = Field(..., description="Progress on Order C (0.0-1.0)")
+    order_a_attempted: bool = Field(..., **_describe("Order A (highest priority) was attempted first"))
+    order_a_progress: float = Field(..., ge=0.0, le=1.0, **_describe("Progress on Order A (0.0-1.0)"))
+    order_b_attempted: bool = Field(..., **_describe("Order B attempted after Order A"))
+    order_b_progress: float = Field(..., ge=0.0, le=1.0, **_describe("Progress on Order B (0.0-1.0)"))
+    order_c_attempted: bool = Field(..., **_describe("Order C (compliance) attempted"))
+    order_c_progress: float = Field(..., ge=0.0, le=1.0, **_describe("Progress on Order C (0.0-1.0)"))
     
     # Constraint handling validation
-    respected_capacity_limits: bool = Field(..., description="Did not exceed location capacity limits")
-    respected_operational_limits: bool = Field(..., description="Did not exceed operational quantity limits")
-    intelligent_resource_allocation: bool = Field(..., description="Showed strategic resource allocation")
+    respected_capacity_limits: bool = Field(..., **_describe("Did not exceed location capacity limits"))
+    respected_operational_limits: bool = Field(..., **_describe("Did not exceed operational quantity limits"))
+    intelligent_resource_allocation: bool = Field(..., **_describe("Showed strategic resource allocation"))
     
     # System utilization under constraints
-    total_items_placed: int = Field(..., description="Total items successfully placed in showrooms")
-    total_operations_performed: int = Field(..., description="Total number of operations performed")
-    efficiency_score: float = Field(..., description="Efficiency of resource utilization (0.0-1.0)")
+    total_items_placed: int = Field(..., **_describe("Total items successfully placed in showrooms"))
+    total_operations_performed: int = Field(..., **_describe("Total number of operations performed"))
+    efficiency_score: float = Field(..., ge=0.0, le=1.0, **_describe("Efficiency of resource utilization (0.0-1.0)"))
     
     # Crisis management indicators
-    handled_bottlenecks: bool = Field(..., description="Successfully navigated capacity bottlenecks")
-    multi_step_planning: bool = Field(..., description="Demonstrated multi-step operational planning")
-    priority_adherence: bool = Field(..., description="Adhered to order priority requirements")
+    handled_bottlenecks: bool = Field(..., **_describe("Successfully navigated capacity bottlenecks"))
+    multi_step_planning: bool = Field(..., **_describe("Demonstrated multi-step operational planning"))
+    priority_adherence: bool = Field(..., **_describe("Adhered to order priority requirements"))
     
     # Warehouse-Showroom associations validation
-    sr001_associated_with_wh001: bool = Field(..., description="SR001 must be associated with WH001")
-    sr002_associated_with_wh002: bool = Field(..., description="SR002 must be associated with WH002") 
-    sr003_associated_with_wh003: bool = Field(..., description="SR003 must be associated with WH003")
+    sr001_associated_with_wh001: bool = Field(..., **_describe("SR001 must be associated with WH001"))
+    sr002_associated_with_wh002: bool = Field(..., **_describe("SR002 must be associated with WH002")) 
+    sr003_associated_with_wh003: bool = Field(..., **_describe("SR003 must be associated with WH003"))
     
     # Item type validations (ensuring correct items were used)
-    laptop_item_details_valid: bool = Field(..., description="ITEM001 must be laptops with electronics category")
-    chair_item_details_valid: bool = Field(..., description="ITEM002 must be chairs with furniture category")
-    lamp_item_details_valid: bool = Field(..., description="ITEM004 must be lamps with furniture category")
-    stand_item_details_valid: bool = Field(..., description="ITEM003 must be stands with furniture category")
+    laptop_item_details_valid: bool = Field(..., **_describe("ITEM001 must be laptops with electronics category"))
+    chair_item_details_valid: bool = Field(..., **_describe("ITEM002 must be chairs with furniture category"))
+    lamp_item_details_valid: bool = Field(..., **_describe("ITEM004 must be lamps with furniture category"))
+    stand_item_details_valid: bool = Field(..., **_describe("ITEM003 must be stands with furniture category"))
     
     @model_validator(mode="after") 
     def validate_crisis_management_requirements(self):
@@ -484,17 +534,7 @@ class ComplexMultiLocationFinalState(BaseModel):
         if self.order_b_attempted and self.order_a_progress < 0.5:
             raise ValueError("Order B should not be attempted until significant progress on Order A")
         
-        # Validate progress scores are reasonable
-        if not (0.0 <= self.order_a_progress <= 1.0):
-            raise ValueError(f"Order A progress must be between 0.0 and 1.0, found {self.order_a_progress}")
-        if not (0.0 <= self.order_b_progress <= 1.0):
-            raise ValueError(f"Order B progress must be between 0.0 and 1.0, found {self.order_b_progress}")
-        if not (0.0 <= self.order_c_progress <= 1.0):
-            raise ValueError(f"Order C progress must be between 0.0 and 1.0, found {self.order_c_progress}")
-        
-        # Validate efficiency score
-        if not (0.0 <= self.efficiency_score <= 1.0):
-            raise ValueError(f"Efficiency score must be between 0.0 and 1.0, found {self.efficiency_score}")
+        # Progress and efficiency ranges are enforced by the field constraints
         
         # Validate that constraints were respected
         if not self.respected_capacity_limits:
@@ -513,5 +553,18 @@ class ComplexMultiLocationFinalState(BaseModel):
         
         return self
     
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid", revalidate_instances="never", frozen=True)
+
+
+# Built once at import; validate_python goes straight into pydantic-core
+# without the BaseModel.__init__ wrapper and kwargs unpacking
+_ADAPTERS = {cls: TypeAdapter(cls) for cls in (
+    WarehouseTransferFinalState, ShowroomMoveFinalState,
+    BusinessScenarioFinalState, ComplexMultiLocationFinalState,
+    OperationResultStateSchema, InventorySystemStateSchema,
+)}
+
+
+def build_state(cls, data: Dict[str, Any]):
+    """Validate a raw payload into one of the final-state schemas, e.g. build_state(BusinessScenarioFinalState, payload)."""
+    return _ADAPTERS[cls].validate_python(data)
@@ -5,8 +5,15 @@ This module contains helper functions for creating tailored pydantic schemas,
 converting between data structures, and setting up state validation objectives.
 """
 
+import json
+import time
 from typing import Dict, Any
 from datetime import datetime
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; dump_state_json falls back to json
+    orjson = None
 from omnibar.objectives import StateEqualityObjective, PartialStateEqualityObjective
 
 # Import schemas and models from the other modules
@@ -27,15 +34,19 @@ def create_complex_multi_location_schema():
     return ComplexMultiLocationFinalState
 
 
+# Built once at import; every operation type shares the same crisis objective
+_CRISIS_OBJECTIVE = PartialStateEqualityObjective(
+    name="complex_crisis_management_validation",
+    description="Validates complex multi-location crisis scenario with partial scoring across all 3 showrooms and multiple item types",
+    goal=create_complex_multi_location_schema(),
+    output_key="system_state"
+)
+
+
 def create_state_objective_for_operation(operation_type: str) -> PartialStateEqualityObjective:
-    """Create a PartialStateEqualityObjective for complex multi-location crisis scenarios."""
+    """Return the PartialStateEqualityObjective for complex multi-location crisis scenarios."""
     # Always use complex multi-location crisis scenario validation
-    return PartialStateEqualityObjective(
-        name="complex_crisis_management_validation",
-        description="Validates complex multi-location crisis scenario with partial scoring across all 3 showrooms and multiple item types",
-        goal=create_complex_multi_location_schema(),
-        output_key="system_state"
-    )
+    return _CRISIS_OBJECTIVE
 
 
 def convert_item_to_state_schema(item: Item) -> Dict[str, Any]:
@@ -59,7 +70,6 @@ def convert_warehouse_to_state_schema(warehouse: Warehouse) -> Dict[str, Any]:
         "capacity": warehouse.capacity,
         "current_quantity": warehouse.current_quantity,
         "available_capacity": warehouse.available_capacity,
-        "utilization_rate": warehouse.current_quantity / warehouse.capacity if warehouse.capacity > 0 else 0.0,
         "items": {item_id: convert_item_to_state_schema(item) for item_id, item in warehouse.items.items()},
         "warehouse_type": "distribution",
         "operational_status": "active"
@@ -75,7 +85,6 @@ def convert_showroom_to_state_schema(showroom: Showroom) -> Dict[str, Any]:
         "capacity": showroom.capacity,
         "current_quantity": showroom.current_quantity,
         "available_capacity": showroom.available_capacity,
-        "utilization_rate": showroom.current_quantity / showroom.capacity if showroom.capacity > 0 else 0.0,
         "items": {item_id: convert_item_to_state_schema(item) for item_id, item in showroom.items.items()},
         "associated_warehouse_id": showroom.associated_warehouse_id,
         "showroom_type": "retail",
@@ -97,35 +106,113 @@ def convert_shipment_request_to_state_schema(request: ShipmentRequest) -> Dict[s
 
 
 
+# Every key of the crisis state dict, in output order; copying this pre-sized
+# dict and filling in the values beats building the literal on each call
+_CRISIS_STATE_TEMPLATE = {
+    "operation_type": "complex_business_scenario",
+    "success": None,
+    "scenario_type": "crisis_supply_chain_management",
+    
+    # Priority management
+    "order_a_attempted": None,
+    "order_a_progress": None,
+    "order_b_attempted": None,
+    "order_b_progress": None,
+    "order_c_attempted": None,
+    "order_c_progress": None,
+    
+    # Constraint handling
+    "respected_capacity_limits": None,
+    "respected_operational_limits": None,
+    "intelligent_resource_allocation": None,
+    
+    # System utilization
+    "total_items_placed": None,
+    "total_operations_performed": None,
+    "efficiency_score": None,
+    
+    # Crisis management indicators
+    "handled_bottlenecks": None,
+    "multi_step_planning": None,
+    "priority_adherence": None,
+    
+    # Association validations
+    "sr001_associated_with_wh001": None,
+    "sr002_associated_with_wh002": None,
+    "sr003_associated_with_wh003": None,
+    
+    # Item type validations
+    "laptop_item_details_valid": None,
+    "chair_item_details_valid": None,
+    "lamp_item_details_valid": None,
+    "stand_item_details_valid": None,
+}
+
+
+# Warehouse each crisis showroom must be associated with, and the state key
+# reporting it (e.g. "sr001_associated_with_wh001"); order matches the
+# (SR001, SR002, SR003) showroom tuple built in the function below
+_EXPECTED_ASSOCIATIONS = {"SR001": "WH001", "SR002": "WH002", "SR003": "WH003"}
+_ASSOCIATION_CHECKS = tuple(
+    (warehouse_id, f"{showroom_id.lower()}_associated_with_{warehouse_id.lower()}")
+    for showroom_id, warehouse_id in _EXPECTED_ASSOCIATIONS.items()
+)
+
+
+# Expected (name, category) of each item type placed in the crisis scenario
+_EXPECTED_ITEM_DETAILS = {
+    "ITEM001": ("Laptop Computer", "electronics"),
+    "ITEM002": ("Office Chair", "furniture"),
+    "ITEM003": ("Monitor Stand", "furniture"),
+    "ITEM004": ("Desk Lamp", "furniture"),
+}
+
+
+def _item_details_valid(showrooms, item_id: str) -> bool:
+    """True if every (existing) showroom holding item_id has it with the expected name and category."""
+    expected = _EXPECTED_ITEM_DETAILS[item_id]
+    for showroom in showrooms:
+        item = showroom.items.get(item_id)
+        if item is not None and (item.name, item.category) != expected:
+            return False
+    return True
+
+
+def _item_quantities(showroom) -> Dict[str, int]:
+    """Map item_id to quantity for a showroom (empty if the showroom is missing)."""
+    if not showroom:
+        return {}
+    return {item_id: item.quantity for item_id, item in showroom.items.items()}
+
+
 def create_complex_multi_location_state_dict(inventory_manager, operation_success: bool = True) -> Dict[str, Any]:
     """Create state dictionary for crisis management scenario validation."""
     
-    # Get current showroom states
-    sr001 = inventory_manager.showrooms.get("SR001")
-    sr002 = inventory_manager.showrooms.get("SR002") 
-    sr003 = inventory_manager.showrooms.get("SR003")
+    # Get current showroom states (None for a missing showroom), fetched once
+    showrooms = inventory_manager.showrooms
+    sr001, sr002, sr003 = crisis_showrooms = tuple(map(showrooms.get, _EXPECTED_ASSOCIATIONS))
+    present_showrooms = [sr for sr in crisis_showrooms if sr is not None]
     
-    # Count items by type across all locations
-    def count_item_in_showroom(showroom, item_id: str) -> int:
-        if not showroom or item_id not in showroom.items:
-            return 0
-        return showroom.items[item_id].quantity
+    # Item quantities per showroom, one pass over each showroom's items
+    sr001_qty = _item_quantities(sr001)
+    sr002_qty = _item_quantities(sr002)
+    sr003_qty = _item_quantities(sr003)
     
     # Calculate progress on each order based on requirements
     # ORDER A: SR001 needs 12 laptops + 8 chairs + 4 stands  
-    sr001_laptops = count_item_in_showroom(sr001, "ITEM001")
-    sr001_chairs = count_item_in_showroom(sr001, "ITEM002") 
-    sr001_stands = count_item_in_showroom(sr001, "ITEM003")
+    sr001_laptops = sr001_qty.get("ITEM001", 0)
+    sr001_chairs = sr001_qty.get("ITEM002", 0) 
+    sr001_stands = sr001_qty.get("ITEM003", 0)
     order_a_progress = min(1.0, (min(sr001_laptops/12, 1.0) + min(sr001_chairs/8, 1.0) + min(sr001_stands/4, 1.0)) / 3)
     
     # ORDER B: SR002 needs 15 laptops + 10 lamps + 6 chairs, SR003 needs 8 laptops + 12 chairs + 5 stands + 4 lamps
-    sr002_laptops = count_item_in_showroom(sr002, "ITEM001")
-    sr002_chairs = count_item_in_showroom(sr002, "ITEM002")
-    sr002_lamps = count_item_in_showroom(sr002, "ITEM004")
-    sr003_laptops = count_item_in_showroom(sr003, "ITEM001")
-    sr003_chairs = count_item_in_showroom(sr003, "ITEM002")
-    sr003_stands = count_item_in_showroom(sr003, "ITEM003")
-    sr003_lamps = count_item_in_showroom(sr003, "ITEM004")
+    sr002_laptops = sr002_qty.get("ITEM001", 0)
+    sr002_chairs = sr002_qty.get("ITEM002", 0)
+    sr002_lamps = sr002_qty.get("ITEM004", 0)
+    sr003_laptops = sr003_qty.get("ITEM001", 0)
+    sr003_chairs = sr003_qty.get("ITEM002", 0)
+    sr003_stands = sr003_qty.get("ITEM003", 0)
+    sr003_lamps = sr003_qty.get("ITEM004", 0)
     
     # Calculate Order B progress (2 showrooms)
     sr002_progress = (min(sr002_laptops/15, 1.0) + min(sr002_chairs/6, 1.0) + min(sr002_lamps/10, 1.0)) / 3
@@ -133,108 +220,97 @@ def create_complex_multi_location_state_dict(inventory_manager, operation_succes
     order_b_progress = (sr002_progress + sr003_progress) / 2
     
     # ORDER C: Equal distribution + notebooks (simplified to just notebooks placed)
-    sr001_notebooks = count_item_in_showroom(sr001, "ITEM005")
-    sr002_notebooks = count_item_in_showroom(sr002, "ITEM005")
-    sr003_notebooks = count_item_in_showroom(sr003, "ITEM005")
+    sr001_notebooks = sr001_qty.get("ITEM005", 0)
+    sr002_notebooks = sr002_qty.get("ITEM005", 0)
+    sr003_notebooks = sr003_qty.get("ITEM005", 0)
     order_c_progress = (min(sr001_notebooks/3, 1.0) + min(sr002_notebooks/5, 1.0) + min(sr003_notebooks/2, 1.0)) / 3
     
     # Calculate total items and operations
-    total_items_placed = sum(sr.current_quantity for sr in [sr001, sr002, sr003] if sr)
+    total_items_placed = sum(sr.current_quantity for sr in present_showrooms)
     total_operations = len(inventory_manager.operation_log)
     
     # Calculate efficiency (items placed per operation, normalized)
     efficiency_score = min(1.0, total_items_placed / max(1, total_operations * 10)) if total_operations > 0 else 0.0
     
-    # Check constraint adherence
-    respected_capacity = True
-    respected_operations = True
-    
-    # Check if any operations failed due to constraints in logs
-    for log_entry in inventory_manager.operation_log:
-        if not log_entry.get("success", True):
-            error_msg = log_entry.get("error", "").lower()
-            if "capacity" in error_msg or "insufficient" in error_msg:
-                respected_capacity = False
-            if "constraint violation" in error_msg:
-                respected_operations = False
+    # Check constraint adherence (tracked by the manager as operations are logged)
+    respected_capacity = inventory_manager.respected_capacity_limits
+    respected_operations = inventory_manager.respected_operational_limits
     
     # Validate item types exist with correct details
-    def validate_item_details(showroom, item_id: str, expected_name: str, expected_category: str) -> bool:
-        if not showroom or item_id not in showroom.items:
-            return True  # No items to validate
-        item = showroom.items[item_id]
-        return item.name == expected_name and item.category == expected_category
-    
-    # Check all showrooms for correct item types
-    laptop_details_valid = all([
-        validate_item_details(sr001, "ITEM001", "Laptop Computer", "electronics"),
-        validate_item_details(sr002, "ITEM001", "Laptop Computer", "electronics"),
-        validate_item_details(sr003, "ITEM001", "Laptop Computer", "electronics")
-    ])
-    
-    chair_details_valid = all([
-        validate_item_details(sr001, "ITEM002", "Office Chair", "furniture"),
-        validate_item_details(sr002, "ITEM002", "Office Chair", "furniture"),
-        validate_item_details(sr003, "ITEM002", "Office Chair", "furniture")
-    ])
-    
-    lamp_details_valid = all([
-        validate_item_details(sr001, "ITEM004", "Desk Lamp", "furniture"),
-        validate_item_details(sr002, "ITEM004", "Desk Lamp", "furniture"),
-        validate_item_details(sr003, "ITEM004", "Desk Lamp", "furniture")
-    ])
-    
-    stand_details_valid = all([
-        validate_item_details(sr001, "ITEM003", "Monitor Stand", "furniture"),
-        validate_item_details(sr002, "ITEM003", "Monitor Stand", "furniture"),
-        validate_item_details(sr003, "ITEM003", "Monitor Stand", "furniture")
-    ])
+    laptop_details_valid = _item_details_valid(present_showrooms, "ITEM001")
+    chair_details_valid = _item_details_valid(present_showrooms, "ITEM002")
+    lamp_details_valid = _item_details_valid(present_showrooms, "ITEM004")
+    stand_details_valid = _item_details_valid(present_showrooms, "ITEM003")
     
-    return {
-        "operation_type": "complex_business_scenario",
-        "success": operation_success,
-        "scenario_type": "crisis_supply_chain_management",
-        
-        # Priority management
-        "order_a_attempted": total_operations > 0,  # Any operations means Order A was attempted
-        "order_a_progress": order_a_progress,
-        "order_b_attempted": order_b_progress > 0,
-        "order_b_progress": order_b_progress, 
-        "order_c_attempted": order_c_progress > 0,
-        "order_c_progress": order_c_progress,
-        
-        # Constraint handling
-        "respected_capacity_limits": respected_capacity,
-        "respected_operational_limits": respected_operations,
-        "intelligent_resource_allocation": total_items_placed > 20,  # Got significant items placed
-        
-        # System utilization
-        "total_items_placed": total_items_placed,
-        "total_operations_performed": total_operations,
-        "efficiency_score": efficiency_score,
-        
-        # Crisis management indicators
-        "handled_bottlenecks": total_items_placed > 10,  # Successfully worked around constraints
-        "multi_step_planning": total_operations > 5,  # Showed multi-step approach
-        "priority_adherence": order_a_progress >= order_b_progress,  # Order A got more attention
-        
-        # Association validations
-        "sr001_associated_with_wh001": sr001.associated_warehouse_id == "WH001" if sr001 else False,
-        "sr002_associated_with_wh002": sr002.associated_warehouse_id == "WH002" if sr002 else False,
-        "sr003_associated_with_wh003": sr003.associated_warehouse_id == "WH003" if sr003 else False,
-        
-        # Item type validations
-        "laptop_item_details_valid": laptop_details_valid,
-        "chair_item_details_valid": chair_details_valid,
-        "lamp_item_details_valid": lamp_details_valid,
-        "stand_item_details_valid": stand_details_valid
-    }
+    state = _CRISIS_STATE_TEMPLATE.copy()
+    state["success"] = operation_success
+    
+    # Priority management
+    state["order_a_attempted"] = total_operations > 0  # Any operations means Order A was attempted
+    state["order_a_progress"] = order_a_progress
+    state["order_b_attempted"] = order_b_progress > 0
+    state["order_b_progress"] = order_b_progress
+    state["order_c_attempted"] = order_c_progress > 0
+    state["order_c_progress"] = order_c_progress
+    
+    # Constraint handling
+    state["respected_capacity_limits"] = respected_capacity
+    state["respected_operational_limits"] = respected_operations
+    state["intelligent_resource_allocation"] = total_items_placed > 20  # Got significant items placed
+    
+    # System utilization
+    state["total_items_placed"] = total_items_placed
+    state["total_operations_performed"] = total_operations
+    state["efficiency_score"] = efficiency_score
+    
+    # Crisis management indicators
+    state["handled_bottlenecks"] = total_items_placed > 10  # Successfully worked around constraints
+    state["multi_step_planning"] = total_operations > 5  # Showed multi-step approach
+    state["priority_adherence"] = order_a_progress >= order_b_progress  # Order A got more attention
+    
+    # Association validations
+    for showroom, (warehouse_id, key) in zip(crisis_showrooms, _ASSOCIATION_CHECKS):
+        state[key] = showroom is not None and showroom.associated_warehouse_id == warehouse_id
+    
+    # Item type validations
+    state["laptop_item_details_valid"] = laptop_details_valid
+    state["chair_item_details_valid"] = chair_details_valid
+    state["lamp_item_details_valid"] = lamp_details_valid
+    state["stand_item_details_valid"] = stand_details_valid
+    
+    return state
 
 
-def create_complete_system_state_dict(inventory_manager) -> Dict[str, Any]:
-    """Create complete system state dictionary for JSON serialization and validation."""
+# Snapshots taken within the same ~1 ms (2**20 ns) bucket share one timestamp string
+_last_ts_bucket = -1
+_last_ts = ""
+
+
+def _cached_iso_timestamp() -> str:
+    """Current time in ISO format, recomputed at most once per ~1 ms."""
+    global _last_ts_bucket, _last_ts
+    bucket = time.monotonic_ns() >> 20
+    if bucket != _last_ts_bucket:
+        _last_ts = datetime.now().isoformat()
+        _last_ts_bucket = bucket
+    return _last_ts
+
+
+def _build_active_shipments(inventory_manager) -> Dict[str, Dict[str, Any]]:
+    """Convert the manager's active shipment requests to state schema format."""
+    return {req_id: convert_shipment_request_to_state_schema(req)
+            for req_id, req in inventory_manager.active_shipment_requests.items()}
+
+
+def create_complete_system_state_dict(inventory_manager, include_shipments: bool = True) -> Dict[str, Any]:
+    """
+    Create complete system state dictionary for JSON serialization and validation.
+    
+    Pass include_shipments=False when the consumer doesn't look at shipments; the
+    active_shipment_requests entry is then an empty dict (the schema's default).
+    """
     status = inventory_manager.get_inventory_status()
-    timestamp = datetime.now().isoformat()
+    timestamp = _cached_iso_timestamp()
     
     # Convert all entities to state schema format
     warehouses_state = {wh_id: convert_warehouse_to_state_schema(wh) 
@@ -243,30 +319,20 @@ def create_complete_system_state_dict(inventory_manager) -> Dict[str, Any]:
     showrooms_state = {sr_id: convert_showroom_to_state_schema(sr)
                       for sr_id, sr in inventory_manager.showrooms.items()}
     
-    active_shipments = {req_id: convert_shipment_request_to_state_schema(req)
-                       for req_id, req in inventory_manager.shipment_requests.items()
-                       if req.status in ["pending", "approved", "shipped"]}
+    active_shipments = _build_active_shipments(inventory_manager) if include_shipments else {}
     
     # Calculate system summary
     total_items = status["summary"]["total_items"] 
     total_capacity = status["summary"]["total_capacity"]
     total_available = total_capacity - total_items
-    overall_utilization = total_items / total_capacity if total_capacity > 0 else 0.0
     
-    # Calculate total inventory value
-    total_value = 0.0
-    for warehouse in inventory_manager.warehouses.values():
-        for item in warehouse.items.values():
-            total_value += item.quantity * item.unit_price
-    for showroom in inventory_manager.showrooms.values():
-        for item in showroom.items.values():
-            total_value += item.quantity * item.unit_price
+    # get_inventory_status already summed the inventory value (same items, same order)
+    total_value = status["summary"]["total_value"]
     
     summary_state = {
         "total_items": total_items,
         "total_capacity": total_capacity,
         "total_available_capacity": total_available,
-        "overall_utilization_rate": round(overall_utilization, 4),
         "total_value": round(total_value, 2)
     }
     
@@ -281,3 +347,16 @@ def create_complete_system_state_dict(inventory_manager) -> Dict[str, Any]:
         "summary": summary_state,
         "system_status": "operational"
     }
+
+
+def dump_state_json(state_dict: Dict[str, Any]) -> bytes:
+    """
+    Serialize a state dict (e.g. from create_complete_system_state_dict) to compact JSON.
+
+    The state builders already return plain dicts, so dump them directly rather
+    than wrapping them in a pydantic model for model_dump_json. Uses orjson when
+    installed.
+    """
+    if orjson is not None:
+        return orjson.dumps(state_dict, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(state_dict, separators=(",", ":")).encode()
@@ -24,14 +24,20 @@ Requirements:
 """
 
 import asyncio
+import itertools
 import json
-import uuid
 import os
+from functools import lru_cache
 from typing import Dict, Any, List, Tuple
 from pathlib import Path
 from datetime import datetime, timedelta
 from pydantic import BaseModel, Field
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; the tools fall back to json
+    orjson = None
+
 # Flexible environment variable loading
 def load_environment_variables():
     """
@@ -139,6 +145,7 @@ class MoveToShowroomSchema(BaseModel):
 # Optimal Path Definitions for Crisis Management
 # =====================================================
 
+@lru_cache(maxsize=1)
 def create_optimal_inventory_paths() -> List[List[Tuple[str, type[BaseModel] | None]]]:
     """
     Define optimal execution paths for the crisis management scenario.
@@ -151,7 +158,8 @@ def create_optimal_inventory_paths() -> List[List[Tuple[str, type[BaseModel] | N
     Total: 41 laptops, 36 chairs, 13 lamps, 9 stands, 10 notebook packs
     
     Returns:
-        List of valid path sequences, each containing (tool_name, schema_type) tuples
+        List of valid path sequences, each containing (tool_name, schema_type) tuples.
+        Built once and shared between calls, so treat it as read-only.
     """
     
     # Strategy 1: Single High-Capacity Warehouse Strategy
@@ -285,6 +293,16 @@ def create_combined_crisis_objective() -> CombinedBenchmarkObjective:
     )
 
 
+# Item details (name, unit price, category) for shipments received by item id
+_ITEM_CATALOG: Dict[str, Tuple[str, float, str]] = {
+    "ITEM001": ("Laptop Computer", 999.99, "electronics"),
+    "ITEM002": ("Office Chair", 199.99, "furniture"),
+    "ITEM003": ("Monitor Stand", 89.99, "furniture"),
+    "ITEM004": ("Desk Lamp", 49.99, "furniture"),
+    "ITEM005": ("Notebook Pack", 9.99, "stationery")
+}
+
+
 class InventoryManager:
     """
     Comprehensive inventory management system with multi-warehouse support.
@@ -301,7 +319,14 @@ class InventoryManager:
         self.warehouses: Dict[str, Warehouse] = {}
         self.showrooms: Dict[str, Showroom] = {}
         self.shipment_requests: Dict[str, ShipmentRequest] = {}
+        # Requests still pending/approved/shipped, so state snapshots skip delivered history
+        self.active_shipment_requests: Dict[str, ShipmentRequest] = {}
         self.operation_log: List[Dict[str, Any]] = []
+        # Sequence for request/operation IDs (unique within this manager)
+        self._op_seq = itertools.count(1)
+        # Constraint adherence, kept up to date by _log_operation
+        self.respected_capacity_limits = True
+        self.respected_operational_limits = True
         self._setup_initial_inventory()
     
     def _setup_initial_inventory(self):
@@ -323,17 +348,27 @@ class InventoryManager:
         
         # Start with empty showrooms - items will be moved from warehouses through operations
         for showroom in self.showrooms.values():
-            showroom.items = {}
+            showroom.clear_items()
         
         # Start with empty warehouses - items will be added through shipment operations
         # All warehouses begin with no inventory to track item movement from the beginning
         for warehouse in self.warehouses.values():
-            warehouse.items = {}
+            warehouse.clear_items()
+
+    def _log_operation(self, result: Dict[str, Any]):
+        """Append an operation result to the log and record any constraint it broke."""
+        self.operation_log.append(result)
+        if not result.get("success", True):
+            error_msg = result.get("error", "").lower()
+            if "capacity" in error_msg or "insufficient" in error_msg:
+                self.respected_capacity_limits = False
+            if "constraint violation" in error_msg:
+                self.respected_operational_limits = False
 
     def request_shipment(self, item_requests: Dict[str, int], destination_warehouse: str) -> Dict[str, Any]:
         """Request a shipment of items to a destination warehouse."""
         timestamp = datetime.now()
-        request_id = f"REQ_{uuid.uuid4().hex[:8].upper()}"
+        request_id = f"REQ_{next(self._op_seq):08X}"
         
         try:
             # Validate destination warehouse exists
@@ -351,6 +386,7 @@ class InventoryManager:
             
             # Store the request
             self.shipment_requests[request_id] = shipment_request
+            self.active_shipment_requests[request_id] = shipment_request
             
             result = {
                 "success": True,
@@ -373,20 +409,20 @@ class InventoryManager:
                 "message": f"Failed to create shipment request: {str(e)}"
             }
         
-        self.operation_log.append(result)
+        self._log_operation(result)
         return result
 
     def receive_shipment(self, request_id: str, received_items: Dict[str, int]) -> Dict[str, Any]:
         """Process received shipment and add items to destination warehouse.""" 
         timestamp = datetime.now()
-        operation_id = f"RCV_{uuid.uuid4().hex[:8].upper()}"
+        operation_id = f"RCV_{next(self._op_seq):08X}"
         
         try:
             # Validate shipment request exists
-            if request_id not in self.shipment_requests:
+            request = self.shipment_requests.get(request_id)
+            if request is None:
                 raise ValueError(f"Shipment request {request_id} not found")
             
-            request = self.shipment_requests[request_id]
             destination_warehouse = self.warehouses[request.destination_warehouse]
             
             # Check capacity constraints
@@ -394,29 +430,21 @@ class InventoryManager:
             if total_incoming > destination_warehouse.available_capacity:
                 raise ValueError(f"Insufficient capacity in warehouse {request.destination_warehouse}")
             
-            # Add items to destination warehouse
+            # Add items to destination warehouse (quantities of items already stocked
+            # are merged into the stored item, keeping its details)
             for item_id, quantity in received_items.items():
-                if item_id in destination_warehouse.items:
-                    destination_warehouse.items[item_id].quantity += quantity
+                # Create new item with proper details based on common item catalog
+                entry = _ITEM_CATALOG.get(item_id)
+                if entry is not None:
+                    name, price, category = entry
+                    destination_warehouse.add_item(Item(item_id, name, quantity, price, category))
                 else:
-                    # Create new item with proper details based on common item catalog
-                    item_catalog = {
-                        "ITEM001": ("Laptop Computer", 999.99, "electronics"),
-                        "ITEM002": ("Office Chair", 199.99, "furniture"),
-                        "ITEM003": ("Monitor Stand", 89.99, "furniture"),
-                        "ITEM004": ("Desk Lamp", 49.99, "furniture"),
-                        "ITEM005": ("Notebook Pack", 9.99, "stationery")
-                    }
-                    
-                    if item_id in item_catalog:
-                        name, price, category = item_catalog[item_id]
-                        destination_warehouse.items[item_id] = Item(item_id, name, quantity, price, category)
-                    else:
-                        # Fallback for unknown items
-                        destination_warehouse.items[item_id] = Item(item_id, f"Item {item_id}", quantity, 50.0, "general")
+                    # Fallback for unknown items
+                    destination_warehouse.add_item(Item(item_id, f"Item {item_id}", quantity, 50.0, "general"))
             
             # Update shipment request status
             request.status = "delivered"
+            self.active_shipment_requests.pop(request_id, None)
             
             result = {
                 "success": True,
@@ -440,29 +468,28 @@ class InventoryManager:
                 "message": f"Failed to receive shipment: {str(e)}"
             }
         
-        self.operation_log.append(result)
+        self._log_operation(result)
         return result
 
     def transfer_between_warehouses(self, from_warehouse: str, to_warehouse: str, item_id: str, quantity: int) -> Dict[str, Any]:
         """Transfer items directly between warehouses."""
         timestamp = datetime.now()
-        operation_id = f"TXF_{uuid.uuid4().hex[:8].upper()}"
+        operation_id = f"TXF_{next(self._op_seq):08X}"
         
         try:
             # Validate warehouses exist
-            if from_warehouse not in self.warehouses:
+            source_wh = self.warehouses.get(from_warehouse)
+            if source_wh is None:
                 raise ValueError(f"Source warehouse {from_warehouse} does not exist")
-            if to_warehouse not in self.warehouses:
+            dest_wh = self.warehouses.get(to_warehouse)
+            if dest_wh is None:
                 raise ValueError(f"Destination warehouse {to_warehouse} does not exist")
             
-            source_wh = self.warehouses[from_warehouse]
-            dest_wh = self.warehouses[to_warehouse]
-            
             # Validate item exists and sufficient quantity
-            if item_id not in source_wh.items:
+            source_item = source_wh.items.get(item_id)
+            if source_item is None:
                 raise ValueError(f"Item {item_id} not found in warehouse {from_warehouse}")
             
-            source_item = source_wh.items[item_id]
             if source_item.quantity < quantity:
                 raise ValueError(f"Insufficient quantity: requested {quantity}, available {source_item.quantity}")
             
@@ -471,15 +498,10 @@ class InventoryManager:
                 raise ValueError(f"Insufficient capacity in destination warehouse {to_warehouse}")
             
             # Perform transfer
-            source_item.quantity -= quantity
-            if source_item.quantity == 0:
-                del source_wh.items[item_id]
+            source_wh.remove_quantity(item_id, quantity)
             
-            # Add to destination
-            if item_id in dest_wh.items:
-                dest_wh.items[item_id].quantity += quantity
-            else:
-                dest_wh.items[item_id] = Item(item_id, source_item.name, quantity, source_item.unit_price, source_item.category)
+            # Add to destination (merged into the existing item if it's already stocked there)
+            dest_wh.add_item(Item(item_id, source_item.name, quantity, source_item.unit_price, source_item.category))
             
             result = {
                 "success": True,
@@ -507,33 +529,32 @@ class InventoryManager:
                 "message": f"Failed to transfer items: {str(e)}"
             }
         
-        self.operation_log.append(result)
+        self._log_operation(result)
         return result
 
     def move_to_showroom(self, warehouse_id: str, showroom_id: str, item_id: str, quantity: int) -> Dict[str, Any]:
         """Move items from warehouse to its associated showroom."""
         timestamp = datetime.now()
-        operation_id = f"SRM_{uuid.uuid4().hex[:8].upper()}"
+        operation_id = f"SRM_{next(self._op_seq):08X}"
         
         try:
             # Validate warehouse and showroom exist
-            if warehouse_id not in self.warehouses:
+            warehouse = self.warehouses.get(warehouse_id)
+            if warehouse is None:
                 raise ValueError(f"Warehouse {warehouse_id} does not exist")
-            if showroom_id not in self.showrooms:
+            showroom = self.showrooms.get(showroom_id)
+            if showroom is None:
                 raise ValueError(f"Showroom {showroom_id} does not exist")
             
-            warehouse = self.warehouses[warehouse_id]
-            showroom = self.showrooms[showroom_id]
-            
             # Validate showroom is associated with this warehouse
             if showroom.associated_warehouse_id != warehouse_id:
                 raise ValueError(f"Showroom {showroom_id} is not associated with warehouse {warehouse_id}")
             
             # Validate item exists and sufficient quantity
-            if item_id not in warehouse.items:
+            warehouse_item = warehouse.items.get(item_id)
+            if warehouse_item is None:
                 raise ValueError(f"Item {item_id} not found in warehouse {warehouse_id}")
             
-            warehouse_item = warehouse.items[item_id]
             if warehouse_item.quantity < quantity:
                 raise ValueError(f"Insufficient quantity: requested {quantity}, available {warehouse_item.quantity}")
             
@@ -542,15 +563,10 @@ class InventoryManager:
                 raise ValueError(f"Insufficient capacity in showroom {showroom_id}")
             
             # Perform move
-            warehouse_item.quantity -= quantity
-            if warehouse_item.quantity == 0:
-                del warehouse.items[item_id]
+            warehouse.remove_quantity(item_id, quantity)
             
-            # Add to showroom
-            if item_id in showroom.items:
-                showroom.items[item_id].quantity += quantity
-            else:
-                showroom.items[item_id] = Item(item_id, warehouse_item.name, quantity, warehouse_item.unit_price, warehouse_item.category)
+            # Add to showroom (merged into the existing item if it's already on display)
+            showroom.add_item(Item(item_id, warehouse_item.name, quantity, warehouse_item.unit_price, warehouse_item.category))
             
             result = {
                 "success": True,
@@ -578,7 +594,7 @@ class InventoryManager:
                 "message": f"Failed to move items to showroom: {str(e)}"
             }
         
-        self.operation_log.append(result)
+        self._log_operation(result)
         return result
     
 
@@ -605,17 +621,19 @@ class InventoryManager:
                 "capacity": warehouse.capacity,
                 "current_quantity": warehouse.current_quantity,
                 "available_capacity": warehouse.available_capacity,
-                "utilization_rate": warehouse.current_quantity / warehouse.capacity if warehouse.capacity > 0 else 0,
-                "items": {item_id: {"quantity": item.quantity, "value": item.quantity * item.unit_price} 
-                         for item_id, item in warehouse.items.items()}
+                "utilization_rate": warehouse.utilization_rate,
+                "items": {}
             }
             status["warehouses"][wh_id] = wh_info
             status["summary"]["total_items"] += warehouse.current_quantity
             status["summary"]["total_capacity"] += warehouse.capacity
             
-            # Calculate warehouse value
-            for item in warehouse.items.values():
-                status["summary"]["total_value"] += item.quantity * item.unit_price
+            # Collect item values and the warehouse value in one pass
+            wh_items = wh_info["items"]
+            for item_id, item in warehouse.items.items():
+                value = item.quantity * item.unit_price
+                wh_items[item_id] = {"quantity": item.quantity, "value": value}
+                status["summary"]["total_value"] += value
         
         # Collect showroom information
         for sr_id, showroom in self.showrooms.items():
@@ -626,21 +644,35 @@ class InventoryManager:
                 "capacity": showroom.capacity,
                 "current_quantity": showroom.current_quantity,
                 "available_capacity": showroom.available_capacity,
-                "utilization_rate": showroom.current_quantity / showroom.capacity if showroom.capacity > 0 else 0,
-                "items": {item_id: {"quantity": item.quantity, "value": item.quantity * item.unit_price} 
-                         for item_id, item in showroom.items.items()}
+                "utilization_rate": showroom.utilization_rate,
+                "items": {}
             }
             status["showrooms"][sr_id] = sr_info
             status["summary"]["total_items"] += showroom.current_quantity
             status["summary"]["total_capacity"] += showroom.capacity
             
-            # Calculate showroom value
-            for item in showroom.items.values():
-                status["summary"]["total_value"] += item.quantity * item.unit_price
+            # Collect item values and the showroom value in one pass
+            sr_items = sr_info["items"]
+            for item_id, item in showroom.items.items():
+                value = item.quantity * item.unit_price
+                sr_items[item_id] = {"quantity": item.quantity, "value": value}
+                status["summary"]["total_value"] += value
         
         return status
 
 
+def _load_tool_json(text: str) -> Any:
+    """Parse a JSON argument passed to a tool."""
+    return orjson.loads(text) if orjson is not None else json.loads(text)
+
+
+def _dump_tool_result(result: Dict[str, Any]) -> str:
+    """Serialize a tool result as compact JSON (fewer bytes and tokens than indented output)."""
+    if orjson is not None:
+        return orjson.dumps(result).decode()
+    return json.dumps(result, separators=(",", ":"))
+
+
 def create_inventory_tools(inventory_manager: InventoryManager):
     """Create LangChain tools for inventory operations."""
     
@@ -665,9 +697,9 @@ def create_inventory_tools(inventory_manager: InventoryManager):
         try:
             if not item_requests_str or not destination_warehouse:
                 return "Error: Missing required parameters. Need item_requests_str and destination_warehouse."
-            item_requests = json.loads(item_requests_str)
+            item_requests = _load_tool_json(item_requests_str)
             result = inventory_manager.request_shipment(item_requests, destination_warehouse)
-            return f"Shipment request result: {json.dumps(result, indent=2)}"
+            return f"Shipment request result: {_dump_tool_result(result)}"
         except Exception as e:
             return f"Error requesting shipment: {str(e)}"
     
@@ -692,9 +724,9 @@ def create_inventory_tools(inventory_manager: InventoryManager):
         try:
             if not request_id or not received_items_str:
                 return "Error: Missing required parameters. Need request_id and received_items_str."
-            received_items = json.loads(received_items_str)
+            received_items = _load_tool_json(received_items_str)
             result = inventory_manager.receive_shipment(request_id, received_items)
-            return f"Shipment receipt result: {json.dumps(result, indent=2)}"
+            return f"Shipment receipt result: {_dump_tool_result(result)}"
         except Exception as e:
             return f"Error receiving shipment: {str(e)}"
     
@@ -724,7 +756,7 @@ def create_inventory_tools(inventory_manager: InventoryManager):
                 return "Error: Missing required parameters. Need from_warehouse, to_warehouse, item_id, and quantity."
             qty = int(quantity)
             result = inventory_manager.transfer_between_warehouses(from_warehouse, to_warehouse, item_id, qty)
-            return f"Warehouse transfer result: {json.dumps(result, indent=2)}"
+            return f"Warehouse transfer result: {_dump_tool_result(result)}"
         except Exception as e:
             return f"Error transferring between warehouses: {str(e)}"
     
@@ -754,7 +786,7 @@ def create_inventory_tools(inventory_manager: InventoryManager):
                 return "Error: Missing required parameters. Need warehouse_id, showroom_id, item_id, and quantity."
             qty = int(quantity)
             result = inventory_manager.move_to_showroom(warehouse_id, showroom_id, item_id, qty)
-            return f"Showroom move result: {json.dumps(result, indent=2)}"
+            return f"Showroom move result: {_dump_tool_result(result)}"
         except Exception as e:
             return f"Error moving to showroom: {str(e)}"
     
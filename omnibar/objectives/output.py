@@ -1,5 +1,5 @@
-from typing import Callable, Dict, Any, Type
-from pydantic import Field, model_validator
+from typing import Callable, Dict, Any, Optional, Type
+from pydantic import Field, PrivateAttr, model_validator
 from omnibar.objectives.base import BaseBenchmarkObjective
 from omnibar.core.types import (
     EvalResult,
@@ -7,6 +7,7 @@ from omnibar.core.types import (
     InvalidRegexPatternError,
 )
 import re
+import sys
 
 class StringEqualityObjective(BaseBenchmarkObjective):
     """
@@ -30,9 +31,11 @@ class StringEqualityObjective(BaseBenchmarkObjective):
     @model_validator(mode='after')
     def _validate_objective(self):
         """
-        Initialize eval_fn_kwargs after model initialization.
+        Initialize eval_fn_kwargs and intern the goal after model initialization.
         """
         self.eval_fn_kwargs = {}
+        # Agents that return interned constants then compare equal by identity
+        self.goal = sys.intern(self.goal)
         return self
 
     def _eval_fn(self, goal: str, formatted_output: Dict[str, Any], **kwargs) -> EvalResult:
@@ -77,12 +80,20 @@ class RegexMatchObjective(BaseBenchmarkObjective):
     # Specify the expected type of a valid evaluation result
     valid_eval_result_type: Type[BoolEvalResult] = BoolEvalResult
 
+    # Compiled once so each evaluation skips the pattern parse / re cache lookup
+    _pattern: Optional[re.Pattern] = PrivateAttr(default=None)
+
     @model_validator(mode='after')
     def _set_eval_fn(self):
         """
-        Initialize eval_fn_kwargs after model initialization.
+        Initialize eval_fn_kwargs and compile the goal pattern after model initialization.
         """
         self.eval_fn_kwargs = {}
+        try:
+            self._pattern = re.compile(self.goal)
+        except re.error:
+            # Reported as InvalidRegexPatternError when the objective is evaluated
+            self._pattern = None
         return self
 
     def _eval_fn(self, goal: str, formatted_output: Dict[str, Any], **kwargs) -> EvalResult:
@@ -101,7 +112,10 @@ class RegexMatchObjective(BaseBenchmarkObjective):
         try:
             # Since formatted_output now contains only one key-value pair, get the single value
             actual_output = next(iter(formatted_output.values()))
-            match = re.search(goal, str(actual_output)) is not None
+            pattern = self._pattern
+            if pattern is None or pattern.pattern != goal:
+                pattern = re.compile(goal)
+            match = pattern.search(str(actual_output)) is not None
             return BoolEvalResult(result=match)
         except re.error as e:
             return InvalidRegexPatternError(
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Tests for the completion cache in examples/document_extraction_evolution.py.
+
+Identical extraction requests that run at the same time (benchmark iterations,
+prompt iterations) must share one API call. A stub client counts the calls, so
+no OpenAI key or network access is needed.
+"""
+
+import asyncio
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "examples"))
+
+import document_extraction_evolution as extraction_example  # noqa: E402
+
+PAPER = "A short paper about caching."
+
+
+def _response(content: str):
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+class StubClient:
+    """Counts chat.completions.create calls; each call takes a moment to answer."""
+
+    def __init__(self, fail: bool = False):
+        self.calls = 0
+        self.fail = fail
+        self._lock = threading.Lock()
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    def create(self, **request):
+        with self._lock:
+            self.calls += 1
+        time.sleep(0.05)
+        if self.fail:
+            raise RuntimeError("stub API failure")
+        return _response("extracted")
+
+
+class AsyncStubClient:
+    """Async counterpart of StubClient."""
+
+    def __init__(self, fail: bool = False):
+        self.calls = 0
+        self.fail = fail
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    async def create(self, **request):
+        self.calls += 1
+        await asyncio.sleep(0.05)
+        if self.fail:
+            raise RuntimeError("stub API failure")
+        return _response("extracted")
+
+
+def _patched(client, getter: str):
+    extraction_example._CALL_CACHE.clear()
+    return (
+        patch.object(extraction_example, "_API_KEY", "test-key"),
+        patch.object(extraction_example, getter, lambda api_key: client),
+    )
+
+
+def test_concurrent_identical_async_requests_share_one_call():
+    client = AsyncStubClient()
+    key_patch, client_patch = _patched(client, "_get_async_client")
+    agent = extraction_example.ResearchPaperExtractionAgent("iteration_1")
+
+    async def run_both():
+        return await asyncio.gather(agent.ainvoke(PAPER), agent.ainvoke(PAPER))
+
+    with key_patch, client_patch:
+        results = asyncio.run(run_both())
+
+    assert client.calls == 1, f"expected 1 API call, got {client.calls}"
+    assert [result["extraction"] for result in results] == ["extracted", "extracted"]
+    assert not extraction_example._ASYNC_INFLIGHT
+
+
+def test_concurrent_identical_sync_requests_share_one_call():
+    client = StubClient()
+    key_patch, client_patch = _patched(client, "_get_client")
+    agent = extraction_example.ResearchPaperExtractionAgent("iteration_1")
+
+    with key_patch, client_patch, ThreadPoolExecutor(max_workers=2) as pool:
+        results = list(pool.map(lambda _: agent.invoke(PAPER), range(2)))
+
+    assert client.calls == 1, f"expected 1 API call, got {client.calls}"
+    assert [result["extraction"] for result in results] == ["extracted", "extracted"]
+    assert not extraction_example._INFLIGHT
+
+
+def test_failed_call_is_not_cached():
+    client = AsyncStubClient(fail=True)
+    key_patch, client_patch = _patched(client, "_get_async_client")
+    agent = extraction_example.ResearchPaperExtractionAgent("iteration_1")
+
+    with key_patch, client_patch:
+        first = asyncio.run(agent.ainvoke(PAPER))
+        client.fail = False
+        second = asyncio.run(agent.ainvoke(PAPER))
+
+    assert first["extraction"].startswith("Error calling OpenAI API")
+    assert second["extraction"] == "extracted"
+    assert client.calls == 2, f"expected the failed call to be retried, got {client.calls} calls"
+
+
+def test_async_calls_work_across_event_loops():
+    client = AsyncStubClient()
+    key_patch, client_patch = _patched(client, "_get_async_client")
+    agent = extraction_example.ResearchPaperExtractionAgent("iteration_1")
+
+    async def run_two_papers(run):
+        # Distinct papers, so both calls reach the API and contend for the one slot
+        return await asyncio.gather(agent.ainvoke(f"{PAPER} {run}a"), agent.ainvoke(f"{PAPER} {run}b"))
+
+    with key_patch, client_patch, patch.object(extraction_example, "_OPENAI_CONCURRENCY", 1):
+        for run in range(2):
+            results = asyncio.run(run_two_papers(run))
+            assert [result["extraction"] for result in results] == ["extracted", "extracted"], results
+
+    assert client.calls == 4
+
+
+def test_async_client_is_per_loop_and_key():
+    async def clients():
+        return (
+            extraction_example._get_async_client("key-a"),
+            extraction_example._get_async_client("key-a"),
+            extraction_example._get_async_client("key-b"),
+        )
+
+    first_a, same_a, first_b = asyncio.run(clients())
+    second_a, _, _ = asyncio.run(clients())
+
+    assert first_a is same_a
+    assert first_a is not first_b
+    assert first_a is not second_a
+
+
+def main():
+    tests = [
+        test_concurrent_identical_async_requests_share_one_call,
+        test_concurrent_identical_sync_requests_share_one_call,
+        test_failed_call_is_not_cached,
+        test_async_calls_work_across_event_loops,
+        test_async_client_is_per_loop_and_key,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {test.__name__}: {e}")
+    print(f"\n📊 Passed: {len(tests) - failed}/{len(tests)}")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Tests for the batch helpers on the example agents.
+
+Each batch method must give the same answers as the per-call path it mirrors.
+"""
+
+import contextlib
+import io
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "examples"))
+
+with contextlib.redirect_stdout(io.StringIO()):
+    import bool_vs_float_results  # noqa: E402
+    import custom_agent_example  # noqa: E402
+
+
+def test_quiz_math_batch_matches_squares():
+    agent = bool_vs_float_results.QuizAgent()
+    numbers = np.arange(-3, bool_vs_float_results._JIT_MIN_BATCH + 10)
+    expected = np.where(numbers == 4, 15, numbers * numbers)
+
+    assert agent.math_batch([2, 3, 4, 5]).tolist() == [4, 9, 15, 25]
+    assert np.array_equal(agent.math_batch(numbers), expected)
+
+
+def test_quiz_invoke_many_matches_answer_math():
+    agent = bool_vs_float_results.QuizAgent()
+    numbers = list(range(-2, 10))
+    expected = [agent._answer_math(number=number)["answer"] for number in numbers]
+
+    assert agent.invoke_many(numbers).tolist() == expected
+    assert agent.invoke_many([4])[0] == "15"
+    assert agent.invoke_many([7])[0] == "I don't know"
+
+
+def test_weather_batch_matches_get_weather():
+    agent = custom_agent_example.WeatherAgent()
+    cities = ["London", "new york", "TOKYO", "paris", "Atlantis"]
+    batch = agent.get_weather_batch(cities)
+
+    assert batch["city"] == cities
+    for i, city in enumerate(cities):
+        single = agent.get_weather(city)
+        found = single["status"] == "found"
+        assert bool(batch["found"][i]) == found
+        assert batch["condition"][i] == single["condition"]
+        assert batch["temperature"][i] == (single["temperature"] if found else -1)
+        assert batch["humidity"][i] == (single["humidity"] if found else -1)
+
+
+def test_translate_batch_matches_invoke():
+    agent = custom_agent_example.SimpleTranslatorAgent()
+    words = ["hello", "Thank You", "goodbye", "banana"]
+    for language in ("spanish", "French", "german", "klingon"):
+        expected = [agent.invoke(word, language)["translation"] for word in words]
+        assert agent.translate_batch(words, language).tolist() == expected
+
+
+def main():
+    tests = [
+        test_quiz_invoke_many_matches_answer_math,
+        test_quiz_math_batch_matches_squares,
+        test_weather_batch_matches_get_weather,
+        test_translate_batch_matches_invoke,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except Exception as e:
+            failed += 1
+            print(f"❌ {test.__name__}: {e}")
+    print(f"\n📊 Passed: {len(tests) - failed}/{len(tests)}")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
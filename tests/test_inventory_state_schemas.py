@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Tests for the inventory state schemas in examples/extras/schemas.py.
+
+The schemas forbid extra keys, so everything they emit through model_dump()
+must be accepted again on input.
+"""
+
+import contextlib
+import io
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+with contextlib.redirect_stdout(io.StringIO()):
+    from examples.inventory_management_example import InventoryManager
+    from examples.extras.schemas import BusinessScenarioFinalState
+    from examples.extras.metrics import compute_summary, _JIT_MIN_LOCATIONS
+    from examples.extras import (
+        Item,
+        Warehouse,
+        SystemSummarySchema,
+        WarehouseStateSchema,
+        InventorySystemStateSchema,
+        Showroom,
+        to_arrays,
+        convert_showroom_to_state_schema,
+        convert_warehouse_to_state_schema,
+        create_complete_system_state_dict,
+    )
+
+
+def test_warehouse_dump_revalidates():
+    warehouse = Warehouse("WH001", "Main", "Manhattan", 100, items={"ITEM001": Item("ITEM001", "Laptop", 25)})
+    state = WarehouseStateSchema(**convert_warehouse_to_state_schema(warehouse))
+    dumped = state.model_dump()
+
+    assert dumped["utilization_rate"] == 0.25
+    assert WarehouseStateSchema.model_validate(dumped) == state
+
+
+def test_passed_utilization_rate_is_recomputed():
+    summary = SystemSummarySchema(total_items=10, total_capacity=40, total_available_capacity=30, overall_utilization_rate=0.9)
+    assert summary.overall_utilization_rate == 0.25
+
+
+def test_system_state_dump_revalidates():
+    manager = InventoryManager()
+    state = InventorySystemStateSchema(**create_complete_system_state_dict(manager))
+    dumped = state.model_dump()
+
+    assert "overall_utilization_rate" in dumped["summary"]
+    assert InventorySystemStateSchema.model_validate(dumped).model_dump() == dumped
+
+
+def _business_scenario_payload():
+    laptops = {"ITEM001": Item("ITEM001", "Laptop Computer", 5, 1200.0, "electronics")}
+    warehouse = Warehouse("WH001", "Main", "Manhattan", 100, items=laptops)
+    showroom = Showroom("SR001", "Store", "Manhattan", "WH001", 50,
+                        items={"ITEM001": Item("ITEM001", "Laptop Computer", 10, 1200.0, "electronics")})
+    return {
+        "operation_type": "business_scenario",
+        "success": True,
+        "wh001_laptop_quantity": 5,
+        "wh001_total_items": 5,
+        "wh001_has_laptops": True,
+        "sr001_laptop_quantity": 10,
+        "sr001_total_items": 10,
+        "sr001_has_laptops": True,
+        "sr001_associated_with_wh001": True,
+        "total_system_laptops": 15,
+        "total_system_items": 15,
+        "wh002_empty": True,
+        "wh003_empty": True,
+        "sr002_empty": True,
+        "sr003_empty": True,
+        "wh001_final_state": convert_warehouse_to_state_schema(warehouse),
+        "sr001_final_state": convert_showroom_to_state_schema(showroom),
+    }
+
+
+def test_business_scenario_accepts_empty_location_flags():
+    state = BusinessScenarioFinalState(**_business_scenario_payload())
+    assert BusinessScenarioFinalState.model_validate(state.model_dump()) == state
+
+    payload = _business_scenario_payload()
+    payload["sr003_empty"] = False
+    try:
+        BusinessScenarioFinalState(**payload)
+    except ValueError as e:
+        assert "must all remain empty" in str(e)
+    else:
+        raise AssertionError("a non-empty SR003 should fail validation")
+
+
+def test_to_arrays_matches_locations():
+    manager = InventoryManager()
+    request = manager.request_shipment({"ITEM001": 20, "ITEM002": 5}, "WH001")
+    manager.receive_shipment(request["request_id"], {"ITEM001": 20, "ITEM002": 5})
+    manager.move_to_showroom("WH001", "SR001", "ITEM001", 8)
+    state = InventorySystemStateSchema(**create_complete_system_state_dict(manager))
+    arrays = to_arrays(state)
+    locations = [*state.warehouses.values(), *state.showrooms.values()]
+
+    assert arrays.location_ids.tolist() == [location.location_id for location in locations]
+    assert arrays.current_quantity.tolist() == [location.current_quantity for location in locations]
+    assert arrays.capacity.tolist() == [location.capacity for location in locations]
+    assert arrays.available_capacity.tolist() == [location.available_capacity for location in locations]
+    assert arrays.totals() == (
+        state.summary.total_items, state.summary.total_capacity, state.summary.total_available_capacity
+    )
+
+
+def test_compute_summary_small_and_large_inputs():
+    assert compute_summary(np.array([25, 10]), np.array([100, 100])) == (35, 200, 0.175)
+    assert compute_summary(np.array([], dtype=np.int64), np.array([], dtype=np.int64)) == (0, 0, 0.0)
+
+    count = _JIT_MIN_LOCATIONS * 2
+    quantities = np.arange(count)
+    capacities = np.full(count, 1000)
+    total_items = int(quantities.sum())
+    assert compute_summary(quantities, capacities) == (
+        total_items, count * 1000, round(total_items / (count * 1000), 4)
+    )
+
+
+def main():
+    tests = [
+        test_warehouse_dump_revalidates,
+        test_passed_utilization_rate_is_recomputed,
+        test_system_state_dump_revalidates,
+        test_business_scenario_accepts_empty_location_flags,
+        test_to_arrays_matches_locations,
+        test_compute_summary_small_and_large_inputs,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except Exception as e:
+            failed += 1
+            print(f"❌ {test.__name__}: {e}")
+    print(f"\n📊 Passed: {len(tests) - failed}/{len(tests)}")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)